@@ -49,6 +49,16 @@ from core.validate import validate_repo
 from core.executive_report import DEFAULT_EXECUTIVE_RUNBOOK, run_executive_report, write_executive_outputs
 
 
+def _jobs_arg(value: str) -> int:
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {jobs}")
+    return jobs
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="bootstrapping-engine",
@@ -119,6 +129,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     report_health.add_argument("--no-hints", action="store_true", help="Disable action hints in report output.")
     report_health.add_argument("--registry", default=None, help="Optional path to systems registry JSON.")
+    report_health.add_argument(
+        "--jobs",
+        type=_jobs_arg,
+        default=1,
+        help="Max concurrent per-system health computations. Output is identical to a serial run.",
+    )
 
     
     report_snapshot = report_sub.add_parser("snapshot", help="Build/write append-only report snapshot ledger entry.")
@@ -764,6 +780,7 @@ def _emit_report_health(
     include_staging: bool,
     include_dev: bool,
     enforce_sla: bool,
+    jobs: int = 1,
 ) -> int:
     history_path = Path("data/snapshots/health_history.jsonl")
     if not history_path.exists() or not load_history(tail=1):
@@ -786,6 +803,7 @@ def _emit_report_health(
         include_hints=include_hints,
         strict_policy=strict_policy,
         as_of=as_of,
+        jobs=jobs,
     )
 
     reasons: list[dict] = []
@@ -1410,6 +1428,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                 include_staging=args.include_staging,
                 include_dev=args.include_dev,
                 enforce_sla=args.enforce_sla,
+                jobs=args.jobs,
             )
         if args.report_command == "graph":
             return _emit_report_graph(args.json, args.registry)
@@ -76,13 +76,8 @@ def render_impact_line(sources: list[str], impacted: list[Impacted]) -> str | No
         return None
 
     # Render first up to 3 impacted (deterministic after sort)
-    parts: list[str] = []
-    for it in impacted[:3]:
-        hop = "hop" if it.distance == 1 else "hops"
-        parts.append(f"{it.system_id} ({it.distance} {hop})")
-
     src_txt = ", ".join(sources)
-    imp_txt = ", ".join(parts)
+    imp_txt = ", ".join(f"{it.system_id} ({it.distance} {'hop' if it.distance == 1 else 'hops'})" for it in impacted[:3])
     more = ""
     if len(impacted) > 3:
         more = f", +{len(impacted) - 3} more"
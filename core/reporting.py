@@ -1,29 +1,67 @@
 from __future__ import annotations
 
+import bisect
+import functools
+import heapq
 import json
-from collections import Counter, deque
+import os
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from core.events import last_event_ts_from_glob
 from core.health import compute_health_for_system
 from core.graph import GraphView, build_graph
 from core.impact import Impacted, compute_impact, render_impact_line
-from core.registry import load_registry, load_registry_systems, registry_path as registry_file_path
+from core.registry import SystemSpec, load_registry, load_registry_systems, registry_path as registry_file_path
 from core.sla import SLA_THRESHOLDS_DAYS, sla_status, tier_threshold_days
+from core.snapshot import append_ledger_entries
 
 
 # NOTE: no new deps; stdlib only.
 
 _TIER_WEIGHT = {"prod": 4.0, "staging": 3.0, "dev": 2.0, "sample": 1.0}
+_STATUS_RANK = {"green": 0, "yellow": 1, "red": 2}
+_STATUS_BY_RANK = ("green", "yellow", "red")
+_DRIFT_MED_DROP = 10
+_DRIFT_HIGH_DROP = 20
+_SEVERITY_ORDER = {"high": 0, "med": 1, "low": 2}
+_TAIL_SEEK_MIN_BYTES = 256 * 1024
+_TAIL_CHUNK_BYTES = 64 * 1024
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+# Shared decoder: skips json.loads' per-call argument checks on the hot JSONL paths.
+_json_decode = json.JSONDecoder().decode
+# Closed status/sla/tier vocabulary: ledger rows share one str object per value.
+_LEDGER_VOCAB = {
+    v: sys.intern(v)
+    for v in ("green", "yellow", "red", "unknown", "ok", "breach", "prod", "staging", "dev", "sample")
+}
+_ONE_US = timedelta(microseconds=1)
+_ONE_DAY = timedelta(hours=24)
+_SECONDS_PER_DAY = 86400
+_STALE_THRESHOLD_DAYS = 14
+
+def _fromisoformat(value: str) -> datetime:
+    # 3.11+ parses a trailing "Z" natively, so the common case needs no rewritten copy.
+    # The "+00:00" rewrite is kept as a fallback for the odd forms only it accepts.
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if "Z" not in value:
+            raise
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
+@functools.lru_cache(maxsize=8192)
 def _parse_ts(value: str) -> datetime | None:
     if not isinstance(value, str) or not value.strip():
         return None
-    normalized = value.replace("Z", "+00:00")
     try:
-        parsed = datetime.fromisoformat(normalized)
+        parsed = _fromisoformat(value)
     except ValueError:
         return None
     if parsed.tzinfo is None:
@@ -32,9 +70,23 @@ def _parse_ts(value: str) -> datetime | None:
 
 
 def _iso_utc(value: datetime) -> str:
+    if value.tzinfo is UTC:
+        # Already UTC: isoformat() always ends in exactly "+00:00"; no conversion or scan.
+        return value.isoformat()[:-6] + "Z"
     return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
+def _sid(row: dict[str, Any]) -> str:
+    # system_id values are almost always str already; skip the str() copy for them.
+    value = row.get("system_id", "")
+    return value.strip() if isinstance(value, str) else str(value).strip()
+
+
+def _vocab_str(value: Any) -> str:
+    text = str(value)
+    return _LEDGER_VOCAB.get(text, text)
+
+
 def _now_utc() -> datetime:
     # Centralized time for deterministic patching/mocking in tests.
     return datetime.now(timezone.utc)
@@ -42,30 +94,71 @@ def _now_utc() -> datetime:
 
 def _parse_iso_utc(ts: str) -> datetime:
     # Accepts ISO timestamps with timezone or Z; missing tz is treated as UTC.
-    if ts.endswith("Z"):
-        ts = ts[:-1] + "+00:00"
-    dt = datetime.fromisoformat(ts)
+    dt = _fromisoformat(ts)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+def _epoch_us(value: datetime) -> int:
+    # Exact integer microseconds since epoch; cheap to compare vs aware datetimes.
+    return (value - _EPOCH) // _ONE_US
+
+
+@functools.lru_cache(maxsize=4096)
+def _ts_epoch_us(ts: str) -> int:
+    return _epoch_us(_parse_iso_utc(ts))
+
+
+def _is_ascending(epochs: list[int]) -> bool:
+    """One linear pairwise pass; callers check once where the series is built."""
+    return all(a <= b for a, b in zip(epochs, epochs[1:]))
+
+
+def _point_series(points: list[dict[str, Any]]) -> tuple[list[int], list[int], bool]:
+    """Parallel (epoch_us, score) arrays for points that carry both ts and score, plus whether epochs ascend."""
+    epochs: list[int] = []
+    scores: list[int] = []
+    ascending = True
+    for p in points:
+        ts = p.get("ts")
+        score = p.get("score")
+        if ts is None or score is None:
+            continue
+        us = _ts_epoch_us(str(ts))
+        if epochs and us < epochs[-1]:
+            ascending = False
+        epochs.append(us)
+        scores.append(int(score))
+    return epochs, scores, ascending
+
+
 def _score_at_or_before(points: list[dict[str, Any]], target: datetime) -> int | None:
     """
     points: [{"ts": iso_str, "score": int}, ...] sorted ascending by ts.
     Returns latest score where ts <= target, else None.
     """
+    return _series_score_at_or_before(*_point_series(points), target)
+
+
+def _series_score_at_or_before(epochs: list[int], scores: list[int], ascending: bool, target: datetime) -> int | None:
+    """_score_at_or_before over parallel (epoch_us, score) arrays; `ascending` comes from the series builder."""
+    target_us = _epoch_us(target)
+    if ascending:
+        # Latest point already at/before the target (e.g. a quiet last day): no search needed.
+        i = len(epochs) - 1 if epochs and epochs[-1] <= target_us else bisect.bisect_right(epochs, target_us) - 1
+        if i < 0:
+            return None
+        # Equal timestamps: the first point of the run wins (matches the linear scan).
+        return scores[bisect.bisect_left(epochs, epochs[i])]
+
+    # Out-of-order points: fall back to a linear scan.
     best: int | None = None
-    best_dt: datetime | None = None
-    for p in points:
-        ts = p.get("ts")
-        score = p.get("score")
-        if ts is None or score is None:
-            continue
-        dt = _parse_iso_utc(str(ts))
-        if dt <= target and (best_dt is None or dt > best_dt):
-            best_dt = dt
-            best = int(score)
+    best_us: int | None = None
+    for us, score in zip(epochs, scores):
+        if us <= target_us and (best_us is None or us > best_us):
+            best_us = us
+            best = score
     return best
 
 
@@ -83,7 +176,7 @@ def _trend_drift_line(trend: dict[str, Any], now_utc: datetime) -> str:
         drift_str = "n/a"
     else:
         latest_score = points[-1].get("score")
-        score_24h = _score_at_or_before(points, now_utc - timedelta(hours=24))
+        score_24h = _score_at_or_before(points, now_utc - _ONE_DAY)
         if latest_score is None or score_24h is None:
             drift_str = "n/a"
         else:
@@ -100,35 +193,93 @@ def _trend_drift_line(trend: dict[str, Any], now_utc: datetime) -> str:
 
     return f"Drift (24h): {drift_str} | Rolling avg: {avg_str}"
 
+_HealthMemo = dict[tuple[str, str, str, str], dict[str, Any]]
+
+
+def _health_key(sid: str, contracts_glob: str, events_glob: str, as_of: datetime | None) -> tuple[str, str, str, str]:
+    # as_of=None (wall clock, no event cutoff) is keyed apart from any explicit instant.
+    stamp = as_of.astimezone(timezone.utc).isoformat() if as_of is not None else ""
+    return (sid, contracts_glob, events_glob, stamp)
+
+
+def _prefetch_health(
+    memo: _HealthMemo,
+    wanted: Iterable[tuple[str, str, str, datetime | None]],
+    *,
+    registry_path: str | None,
+    jobs: int,
+) -> None:
+    """Fill memo for the wanted computes on a thread pool; readers stay serial and ordered."""
+    if jobs <= 1:
+        return
+    pending: dict[tuple[str, str, str, str], tuple[str, str, str, datetime | None]] = {}
+    for args in wanted:
+        key = _health_key(*args)
+        if key not in memo:
+            pending.setdefault(key, args)
+    if len(pending) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            key: pool.submit(compute_health_for_system, sid, cg, eg, registry_path=registry_path, as_of=as_of)
+            for key, (sid, cg, eg, as_of) in pending.items()
+        }
+        for key, future in futures.items():
+            memo[key] = future.result()
+
+
+def _memo_health(
+    memo: _HealthMemo,
+    sid: str,
+    contracts_glob: str,
+    events_glob: str,
+    *,
+    registry_path: str | None,
+    as_of: datetime | None,
+) -> dict[str, Any]:
+    key = _health_key(sid, contracts_glob, events_glob, as_of)
+    cached = memo.get(key)
+    if cached is not None:
+        return cached
+    payload = compute_health_for_system(sid, contracts_glob, events_glob, registry_path=registry_path, as_of=as_of)
+    memo[key] = payload
+    return payload
+
+
 def _drift_contributors(
     systems: list[dict[str, Any]],
     *,
     now_utc: datetime,
     registry_path: str | None = None,
+    memo: _HealthMemo | None = None,
+    jobs: int = 1,
 ) -> list[tuple[str, int]]:
     drops: list[tuple[str, int]] = []
     t0 = now_utc
-    t1 = now_utc - timedelta(hours=24)
-    cache: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+    t1 = now_utc - _ONE_DAY
+    cache: _HealthMemo = memo if memo is not None else {}
 
     def _health_at(sid: str, contracts_glob: str, events_glob: str, as_of: datetime) -> dict[str, Any]:
-        key = (sid, contracts_glob, events_glob, as_of.astimezone(timezone.utc).isoformat())
-        cached = cache.get(key)
-        if cached is not None:
-            return cached
-        payload = compute_health_for_system(sid, contracts_glob, events_glob, registry_path=registry_path, as_of=as_of)
-        cache[key] = payload
-        return payload
+        return _memo_health(cache, sid, contracts_glob, events_glob, registry_path=registry_path, as_of=as_of)
 
+    targets: list[tuple[str, str, str]] = []
     for s in systems:
         if s.get("is_sample"):
             continue
-        sid = str(s.get("system_id", "")).strip()
+        sid = _sid(s)
         contracts_glob = str(s.get("contracts_glob", "")).strip()
         events_glob = str(s.get("events_glob", "")).strip()
         if not sid or not contracts_glob or not events_glob:
             continue
+        targets.append((sid, contracts_glob, events_glob))
 
+    _prefetch_health(
+        cache,
+        [(*target, at) for target in targets for at in (t0, t1)],
+        registry_path=registry_path,
+        jobs=jobs,
+    )
+    for sid, contracts_glob, events_glob in targets:
         h_now = _health_at(sid, contracts_glob, events_glob, t0)
         h_24 = _health_at(sid, contracts_glob, events_glob, t1)
 
@@ -142,39 +293,63 @@ def _drift_contributors(
     return drops[:3]
 
 
+def _drift_scores(points: list[dict[str, Any]], now_utc: datetime) -> tuple[int, int] | None:
+    """(latest_score, score_at_or_before(now - 24h)), or None when history is insufficient."""
+    if not points:
+        return None
+    latest = points[-1].get("score")
+    latest_ts = points[-1].get("ts")
+    if latest is None or latest_ts is None:
+        return None
+    return _series_drift_scores(*_point_series(points), now_utc)
+
+
+def _series_drift_scores(
+    epochs: list[int], scores: list[int], ascending: bool, now_utc: datetime
+) -> tuple[int, int] | None:
+    """_drift_scores over parallel (epoch_us, score) arrays whose last entry is the latest point."""
+    if not scores:
+        return None
+    score_24h = _series_score_at_or_before(epochs, scores, ascending, now_utc - _ONE_DAY)
+    if score_24h is None:
+        return None
+    return scores[-1], score_24h
+
+
+def _contributors_line(contributors: list[tuple[str, int]]) -> str:
+    return " | ".join(f"{sid} -{drop}" for sid, drop in contributors)
+
+
 def build_drift_hint(
     *,
     points: list[dict[str, Any]],
     rolling_avg: float | int | None,
     now_utc: datetime,
     contributors: list[tuple[str, int]] | None = None,
+    scores: tuple[int, int] | None = None,
+    top_line: str | None = None,
 ) -> dict[str, Any] | None:
     """
     Deterministic drift detection:
     - Compare latest score vs score at/before now-24h.
     - MED if drop >10, HIGH if drop >20.
     - If insufficient history, no hint.
+    - `scores` may carry a precomputed _drift_scores(points, now_utc) result,
+      and `top_line` a prebuilt _contributors_line(contributors).
     """
-    if not points:
-        return None
-
-    latest = points[-1].get("score")
-    latest_ts = points[-1].get("ts")
-    if latest is None or latest_ts is None:
-        return None
-
-    latest_score = int(latest)
-    score_24h = _score_at_or_before(points, now_utc - timedelta(hours=24))
-    if score_24h is None:
+    if scores is None:
+        scores = _drift_scores(points, now_utc)
+    if scores is None:
         return None
+    latest_score, score_24h = scores
 
     # Drift semantics: latest_score - score_at_or_before(now - 24h)
     drift = latest_score - score_24h
     drop = -drift
-    if drop <= 10:
+    if drop <= _DRIFT_MED_DROP:
         return None
 
-    severity = "med" if drop <= 20 else "high"
+    severity = "med" if drop <= _DRIFT_HIGH_DROP else "high"
     why = f"Score dropped {drop} points vs 24h ago ({score_24h} -> {latest_score})."
     if rolling_avg is not None:
         try:
@@ -186,7 +361,8 @@ def build_drift_hint(
     systems: list[str] = []
     if contributors:
         systems = [sid for sid, _drop in contributors]
-        top_line = " | ".join(f"{sid} -{drop}" for sid, drop in contributors)
+        if top_line is None:
+            top_line = _contributors_line(contributors)
         why += f" Top drift (24h): {top_line}."
 
     return {
@@ -198,21 +374,73 @@ def build_drift_hint(
     }
 
 
+def _rows_with_ts(rows: list[dict[str, Any]]) -> list[tuple[datetime | None, dict[str, Any]]]:
+    """Pair each history row with its parsed ts; the only place report rows get parsed."""
+    return [(_parse_ts(str(row.get("ts", ""))), row) for row in rows]
+
+
+def _is_chronological(stamped: list[tuple[datetime | None, dict[str, Any]]]) -> bool:
+    prev: datetime | None = None
+    for ts, _row in stamped:
+        if ts is None or (prev is not None and ts < prev):
+            return False
+        prev = ts
+    return True
+
+
+def _tail_lines(path: Path, n: int) -> list[str]:
+    """Last n non-blank lines, read backward from EOF in fixed-size chunks."""
+    rev: list[str] = []
+    carry = b""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and len(rev) < n:
+            step = min(_TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + carry).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier chunk.
+            carry = parts.pop(0) if pos > 0 else b""
+            for raw in reversed(parts):
+                # Blank is judged on the decoded str, as in the forward read: bytes.strip()
+                # keeps NBSP, U+0085 and \x1c-\x1f, which str.strip() removes.
+                line = raw.decode("utf-8")
+                if line.strip():
+                    rev.append(line)
+                    if len(rev) == n:
+                        break
+    rev.reverse()
+    return rev
+
+
 def load_history(tail: int = 2000, path: str | Path | None = None) -> list[dict[str, Any]]:
     history_path = Path(path) if path is not None else Path("data/snapshots/health_history.jsonl")
-    if not history_path.exists():
+    try:
+        size = history_path.stat().st_size
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    buf: deque[str] = deque(maxlen=max(1, int(tail)))
-    with history_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                buf.append(line)
+    limit = max(1, int(tail))
+    buf: deque[str] | list[str]
+    if size >= _TAIL_SEEK_MIN_BYTES:
+        # Large history: only touch the bytes that hold the last `limit` lines.
+        buf = _tail_lines(history_path, limit)
+    else:
+        buf = deque(maxlen=limit)
+        with history_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    buf.append(line)
+
+    return _parse_history_lines(buf)
+
 
+def _parse_history_lines(lines: Iterable[str]) -> list[dict[str, Any]]:
+    """Decode JSONL rows, dropping invalid lines and non-object values."""
     out: list[dict[str, Any]] = []
-    for line in buf:
+    for line in lines:
         try:
-            payload = json.loads(line)
+            payload = _json_decode(line)
         except json.JSONDecodeError:
             continue
         if isinstance(payload, dict):
@@ -220,10 +448,26 @@ def load_history(tail: int = 2000, path: str | Path | None = None) -> list[dict[
     return out
 
 
-def _current_system_health(registry_path: str | None, *, as_of: datetime | None = None) -> list[dict[str, Any]]:
+def _current_system_health(
+    registry_path: str | None,
+    *,
+    as_of: datetime | None = None,
+    specs: list[SystemSpec] | None = None,
+    memo: _HealthMemo | None = None,
+    jobs: int = 1,
+) -> list[dict[str, Any]]:
     systems: list[dict[str, Any]] = []
-    for spec in load_registry(registry_path):
-        payload = compute_health_for_system(
+    cache: _HealthMemo = memo if memo is not None else {}
+    specs = specs if specs is not None else load_registry(registry_path)
+    _prefetch_health(
+        cache,
+        [(spec.system_id, spec.contracts_glob, spec.events_glob, as_of) for spec in specs],
+        registry_path=registry_path,
+        jobs=jobs,
+    )
+    for spec in specs:
+        payload = _memo_health(
+            cache,
             spec.system_id,
             spec.contracts_glob,
             spec.events_glob,
@@ -242,41 +486,55 @@ def _current_system_health(registry_path: str | None, *, as_of: datetime | None
     return systems
 
 
-def _system_recency(registry_path: str | None, *, as_of: datetime | None = None) -> list[dict[str, Any]]:
-    now = as_of.astimezone(UTC) if as_of is not None else datetime.now(UTC)
+def _system_recency(
+    registry_path: str | None,
+    *,
+    as_of: datetime | None = None,
+    specs: list[SystemSpec] | None = None,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    # Registry order (load_registry_systems sorts by system_id) is the canonical deterministic
+    # order, so rows are emitted as the specs are walked; callers pass specs in that order.
+    if now is None:
+        now = as_of.astimezone(UTC) if as_of is not None else datetime.now(UTC)
     recency: list[dict[str, Any]] = []
+    # Systems that share an events glob share one scan of the matching log files.
+    last_by_glob: dict[str, datetime | None] = {}
 
-    for spec in load_registry(registry_path):
-        last = last_event_ts_from_glob(spec.events_glob, registry_path=registry_path, as_of=as_of)
-        days = 999999 if last is None else max(0, int((now - last).total_seconds() // 86400))
+    for spec in specs if specs is not None else load_registry(registry_path):
+        if spec.events_glob in last_by_glob:
+            last = last_by_glob[spec.events_glob]
+        else:
+            last = last_event_ts_from_glob(spec.events_glob, registry_path=registry_path, as_of=as_of)
+            last_by_glob[spec.events_glob] = last
+        days = 999999 if last is None else max(0, int((now - last).total_seconds() // _SECONDS_PER_DAY))
         recency.append(
             {
                 "system_id": spec.system_id,
                 "is_sample": spec.is_sample,
                 "days_since_last_event": days,
                 "last_event_ts": _iso_utc(last) if last is not None else None,
-                "stale": days > 14,
+                "stale": days > _STALE_THRESHOLD_DAYS,
             }
         )
-
-    recency.sort(key=lambda row: str(row.get("system_id", "")))
     return recency
 
 
-def _aggregate_non_sample(current_systems: list[dict[str, Any]]) -> dict[str, Any]:
-    non_sample = [row for row in current_systems if not row.get("is_sample", False)]
+def _aggregate_non_sample(non_sample: list[dict[str, Any]]) -> dict[str, Any]:
     if not non_sample:
         return {"status": "unknown", "score_total": 0.0, "strict_ready_now": True}
 
-    statuses = [str(row.get("status", "unknown")) for row in non_sample]
-    if any(status == "red" for status in statuses):
-        status = "red"
-    elif any(status == "yellow" for status in statuses):
-        status = "yellow"
-    else:
-        status = "green"
-
-    avg_score = sum(float(row.get("score_total", 0.0)) for row in non_sample) / len(non_sample)
+    # One pass: worst status by rank (anything unrecognised counts as green) plus the score sum.
+    worst = 0
+    total = 0.0
+    for row in non_sample:
+        rank = _STATUS_RANK.get(str(row.get("status", "unknown")), 0)
+        if rank > worst:
+            worst = rank
+        total += float(row.get("score_total", 0.0))
+    status = _STATUS_BY_RANK[worst]
+
+    avg_score = total / len(non_sample)
     strict_ready_now = status != "red"
     return {
         "status": status,
@@ -292,17 +550,19 @@ def _augment_current_systems(
     *,
     as_of: datetime,
 ) -> list[dict[str, Any]]:
-    recency_by_id = {str(row.get("system_id", "")): row for row in recency_rows}
+    # Rows come from _system_recency, so system_id is already a clean string.
+    recency_by_id = {
+        row["system_id"]: (int(row.get("days_since_last_event", 999999)), row.get("last_event_ts"))
+        for row in recency_rows
+    }
     by_id = {str(spec.system_id): spec for spec in systems}
     out: list[dict[str, Any]] = []
     for row in sorted(current_systems, key=lambda r: str(r.get("system_id", ""))):
-        system_id = str(row.get("system_id", "")).strip()
+        system_id = _sid(row)
         spec = by_id.get(system_id)
         tier = str(getattr(spec, "tier", "prod")) if spec is not None else "prod"
         owners = sorted([str(x) for x in getattr(spec, "owners", ())]) if spec is not None else []
-        recency = recency_by_id.get(system_id, {})
-        days = int(recency.get("days_since_last_event", 999999))
-        last_event_ts = recency.get("last_event_ts")
+        days, last_event_ts = recency_by_id.get(system_id, (999999, None))
         status = sla_status(last_event_ts, tier, as_of=as_of)
         max_days = tier_threshold_days(tier)
         escalation_hint = (
@@ -328,12 +588,19 @@ def _risk_scores(g: GraphView, sources: list[str]) -> list[dict[str, Any]]:
     if not sources:
         return []
     risk_rows: list[dict[str, Any]] = []
+    tiers = g.tiers
     for source in sorted(set(sources)):
-        tier = g.tiers.get(source, "prod")
+        tier = tiers.get(source, "prod")
         tier_weight = _TIER_WEIGHT.get(tier, 1.0)
         _, impacted = compute_impact(g, [source])
-        dependents_count = len(impacted)
-        avg_distance = (sum(x.distance for x in impacted) / dependents_count) if dependents_count else 0.0
+        # One pass over impacted: distance sum + payload rows.
+        dist_sum = 0
+        impacted_rows: list[dict[str, Any]] = []
+        for x in impacted:
+            dist_sum += x.distance
+            impacted_rows.append({"system_id": x.system_id, "distance": x.distance, "tier": x.tier})
+        dependents_count = len(impacted_rows)
+        avg_distance = (dist_sum / dependents_count) if dependents_count else 0.0
         avg_distance_weight = 1.0 if dependents_count == 0 else (1.0 + (1.0 / (1.0 + avg_distance)))
         risk_score = round(tier_weight * (1.0 + dependents_count) * avg_distance_weight, 2)
         risk_rows.append(
@@ -343,10 +610,7 @@ def _risk_scores(g: GraphView, sources: list[str]) -> list[dict[str, Any]]:
                 "dependents_count": dependents_count,
                 "avg_distance": round(avg_distance, 2),
                 "risk_score": risk_score,
-                "impacted": [
-                    {"system_id": x.system_id, "distance": x.distance, "tier": x.tier}
-                    for x in impacted
-                ],
+                "impacted": impacted_rows,
             }
         )
     risk_rows.sort(key=lambda r: (-float(r["risk_score"]), str(r["system_id"])))
@@ -380,78 +644,72 @@ def _sla_hints(current_systems: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return hints[:2]
 
 
+# Shared, read-only hint templates; _build_hints copies fields out and never mutates these.
+_HINT_TEMPLATES: dict[str, dict[str, str]] = {
+    "PRIMITIVES_MIN": {
+        "title": "System contract missing minimum primitives",
+        "why": "Contract must declare >=3 primitives_used to stay enforceable.",
+        "fix": (
+            "Edit the system contract JSON and set primitives_used to at least 3 items "
+            '(e.g., ["P0","P1","P7"]). Re-run: python -m app.main health --all --strict'
+        ),
+    },
+    "INVARIANTS_MIN": {
+        "title": "System contract missing minimum invariants",
+        "why": "Contract must reference >=3 invariant IDs to define what must remain true.",
+        "fix": (
+            "Edit the system contract JSON and set invariants to at least 3 IDs "
+            '(e.g., ["INV-001","INV-002","INV-003"]). Re-run: python -m app.main health --all --strict'
+        ),
+    },
+    "EVENTS_RECENT": {
+        "title": "System is stale (no recent events)",
+        "why": "Systems must emit events within 14 days to prove they're alive.",
+        "fix": "Run: python -m app.main log <system_id> status_update (or run the system). Then re-run strict.",
+    },
+}
+_HINT_DEFAULT: dict[str, str] = {
+    "title": "Health violation requires attention",
+    "why": "A health rule is failing.",
+    "fix": "Inspect report.systems.status for violations and update contract/events accordingly.",
+}
+
+
 def _hint_template(code: str) -> dict[str, str]:
-    if code == "PRIMITIVES_MIN":
-        return {
-            "title": "System contract missing minimum primitives",
-            "why": "Contract must declare >=3 primitives_used to stay enforceable.",
-            "fix": (
-                "Edit the system contract JSON and set primitives_used to at least 3 items "
-                '(e.g., ["P0","P1","P7"]). Re-run: python -m app.main health --all --strict'
-            ),
-        }
-    if code == "INVARIANTS_MIN":
-        return {
-            "title": "System contract missing minimum invariants",
-            "why": "Contract must reference >=3 invariant IDs to define what must remain true.",
-            "fix": (
-                "Edit the system contract JSON and set invariants to at least 3 IDs "
-                '(e.g., ["INV-001","INV-002","INV-003"]). Re-run: python -m app.main health --all --strict'
-            ),
-        }
-    if code == "EVENTS_RECENT":
-        return {
-            "title": "System is stale (no recent events)",
-            "why": "Systems must emit events within 14 days to prove they're alive.",
-            "fix": "Run: python -m app.main log <system_id> status_update (or run the system). Then re-run strict.",
-        }
-    return {
-        "title": "Health violation requires attention",
-        "why": "A health rule is failing.",
-        "fix": "Inspect report.systems.status for violations and update contract/events accordingly.",
-    }
+    return _HINT_TEMPLATES.get(code, _HINT_DEFAULT)
 
 
-def _build_hints(current_systems: list[dict[str, Any]], snapshot_status: str, include_hints: bool) -> list[dict[str, Any]]:
+def _build_hints(
+    red_non_sample: list[dict[str, Any]],
+    red_sample: list[dict[str, Any]],
+    snapshot_status: str,
+    include_hints: bool,
+) -> list[dict[str, Any]]:
     if not include_hints:
         return []
 
-    red_non_sample = [row for row in current_systems if not row.get("is_sample", False) and row.get("status") == "red"]
     if red_non_sample:
-        affected_by_violation: dict[str, set[str]] = {}
-        freq: Counter[str] = Counter()
+        affected_by_violation: defaultdict[str, set[str]] = defaultdict(set)
+        freq: dict[str, int] = {}
         for row in red_non_sample:
-            system_id = str(row.get("system_id", "")).strip()
+            system_id = _sid(row)
             for code in row.get("violations", []) or []:
-                key = str(code)
-                freq[key] += 1
-                affected_by_violation.setdefault(key, set()).add(system_id)
+                key = code if isinstance(code, str) else str(code)
+                freq[key] = freq.get(key, 0) + 1
+                affected_by_violation[key].add(system_id)
 
-        top = sorted(
-            freq.items(),
-            key=lambda kv: (-kv[1], kv[0]),
-        )[:2]
+        top = heapq.nsmallest(2, freq.items(), key=lambda kv: (-kv[1], kv[0]))
 
         hints: list[dict[str, Any]] = []
         for code, _count in top:
-            tpl = _hint_template(code)
+            # Spread keeps the original key order: severity, title, why, fix, systems.
             hints.append(
-                {
-                    "severity": "high",
-                    "title": tpl["title"],
-                    "why": tpl["why"],
-                    "fix": tpl["fix"],
-                    "systems": sorted(affected_by_violation.get(code, set())),
-                }
+                {"severity": "high", **_hint_template(code), "systems": sorted(affected_by_violation[code])}
             )
         return hints
 
     if snapshot_status == "red":
-        sample_red_ids = sorted(
-            str(row.get("system_id", "")).strip()
-            for row in current_systems
-            if row.get("is_sample", False) and row.get("status") == "red"
-        )
+        sample_red_ids = sorted(_sid(row) for row in red_sample)
         return [
             {
                 "severity": "low",
@@ -494,7 +752,7 @@ def _select_impact_sources(
     src: set[str] = set()
 
     for row in current_systems:
-        sid = str(row.get("system_id", "")).strip()
+        sid = _sid(row)
         if not sid:
             continue
         if bool(row.get("is_sample", False)):
@@ -517,12 +775,9 @@ def _impact_suffix(g: GraphView, sources: list[str]) -> str:
     _, impacted = compute_impact(g, sources)
     if not impacted:
         return ""
-    parts: list[str] = []
-    for it in impacted[:3]:
-        hop = "hop" if it.distance == 1 else "hops"
-        parts.append(f"{it.system_id} ({it.distance} {hop})")
+    shown = ", ".join(f"{it.system_id} ({it.distance} {'hop' if it.distance == 1 else 'hops'})" for it in impacted[:3])
     more = f", +{len(impacted) - 3} more" if len(impacted) > 3 else ""
-    return " Impacted: " + ", ".join(parts) + more
+    return f" Impacted: {shown}{more}"
 
 
 def compute_report(
@@ -534,29 +789,48 @@ def compute_report(
     include_hints: bool = True,
     strict_policy: dict[str, Any] | None = None,
     as_of: datetime | None = None,
+    jobs: int = 1,
 ) -> dict[str, Any]:
     loaded = load_history(tail=tail, path=history_path)
     now = as_of.astimezone(UTC) if as_of is not None else _now_utc().astimezone(UTC)
-    if as_of is not None:
-        loaded = [row for row in loaded if (ts := _parse_ts(str(row.get("ts", "")))) is not None and ts <= now]
+    # Parse each row's ts exactly once; every later pass reads it from these pairs.
+    stamped = _rows_with_ts(loaded)
     cutoff = now - timedelta(days=max(0, int(days)))
-
-    analyzed: list[dict[str, Any]] = []
-    for row in loaded:
-        ts = _parse_ts(str(row.get("ts", "")))
-        if ts is not None and ts >= cutoff:
-            analyzed.append(row)
-    if not analyzed:
-        analyzed = loaded
+    # Append-only history is normally chronological: window it with two binary searches.
+    # Out-of-order or unparsable rows fall back to the linear filters.
+    chronological = _is_chronological(stamped)
+    if chronological:
+        by_ts = itemgetter(0)
+        if as_of is not None:
+            stamped = stamped[: bisect.bisect_right(stamped, now, key=by_ts)]
+            loaded = [row for _ts, row in stamped]
+        # When the oldest row already clears the cutoff, the window is the whole history.
+        first = 0 if not stamped or stamped[0][0] >= cutoff else bisect.bisect_left(stamped, cutoff, key=by_ts)
+        analyzed_stamped = stamped[first:] if first else stamped
+    else:
+        if as_of is not None:
+            stamped = [(ts, row) for ts, row in stamped if ts is not None and ts <= now]
+            loaded = [row for _ts, row in stamped]
+        analyzed_stamped = [(ts, row) for ts, row in stamped if ts is not None and ts >= cutoff]
+    if not analyzed_stamped:
+        analyzed_stamped = stamped
+    # `loaded` always mirrors `stamped`, so a full window reuses it instead of rebuilding.
+    analyzed = loaded if analyzed_stamped is stamped else [row for _ts, row in analyzed_stamped]
 
     latest = loaded[-1] if loaded else {}
-    current_systems = _current_system_health(registry_path, as_of=as_of)
+    # Parse the registry once (one open, no exists() probe) and share the specs with every helper.
     reg_path = registry_file_path(registry_path)
-    registry_obj: Any = {"systems": []}
-    if reg_path.exists():
-        registry_obj = json.loads(reg_path.read_text(encoding="utf-8"))
+    registry_obj: Any
+    try:
+        with reg_path.open("rb") as f:
+            registry_obj = _json_decode(f.read().decode("utf-8"))
+    except FileNotFoundError:
+        registry_obj = {"systems": []}
 
     systems = load_registry_systems(registry_obj)
+    # One health memo per report: replay reports (as_of set) reuse the "now" computes in drift attribution.
+    health_memo: _HealthMemo = {}
+    current_systems = _current_system_health(registry_path, as_of=as_of, specs=systems, memo=health_memo, jobs=jobs)
     g = build_graph(systems)
 
     registry_rows = [
@@ -571,48 +845,85 @@ def compute_report(
         }
         for s in systems
     ]
-    recency_rows = _system_recency(registry_path, as_of=as_of)
+    recency_rows = _system_recency(registry_path, as_of=as_of, specs=systems, now=now)
     current_systems = _augment_current_systems(current_systems, systems, recency_rows, as_of=now)
-    now_non_sample = _aggregate_non_sample(current_systems)
+    # Classify every system once; the aggregate, hint and impact helpers take the pre-split rows.
+    non_sample_rows: list[dict[str, Any]] = []
+    red_non_sample: list[dict[str, Any]] = []
+    red_sample: list[dict[str, Any]] = []
+    flagged_rows: list[dict[str, Any]] = []
+    for row in current_systems:
+        status = row.get("status")
+        if row.get("is_sample", False):
+            if status == "red":
+                red_sample.append(row)
+            continue
+        non_sample_rows.append(row)
+        if status == "red":
+            red_non_sample.append(row)
+            flagged_rows.append(row)
+        elif status == "yellow":
+            flagged_rows.append(row)
+    now_non_sample = _aggregate_non_sample(non_sample_rows)
     strict_ready_now = bool(now_non_sample["strict_ready_now"])
 
-    score_values = [float(row.get("score_total", 0.0)) for row in analyzed]
-    start_score = score_values[0] if score_values else 0.0
-    end_score = score_values[-1] if score_values else 0.0
-    avg_score = sum(score_values) / len(score_values) if score_values else 0.0
-
-    parsed_ts = [_parse_ts(str(row.get("ts", ""))) for row in analyzed]
-    valid_ts = [ts for ts in parsed_ts if ts is not None]
+    # First/last read straight off the window; the mean streams through sum() without a list.
+    # (sum() rather than a += loop: it is compensated on 3.12+, so results match across versions.)
+    start_score = end_score = avg_score = 0.0
+    if analyzed:
+        start_score = float(analyzed[0].get("score_total", 0.0))
+        end_score = float(analyzed[-1].get("score_total", 0.0))
+        avg_score = sum(float(row.get("score_total", 0.0)) for row in analyzed) / len(analyzed)
+
+    # One walk over the window: ts range, violation stats and the trend series together.
+    min_ts: datetime | None = None
+    max_ts: datetime | None = None
+    # Chronological windows carry their range at the ends; only unordered ones need per-row compares.
+    track_range = not (chronological and analyzed_stamped)
+    if not track_range:
+        min_ts = analyzed_stamped[0][0]
+        max_ts = analyzed_stamped[-1][0]
+    # code -> [count, last_seen_ts]; one lookup per code per row.
+    violation_stats: dict[str, list[Any]] = {}
+    # Trend series as parallel arrays; the point dicts are only built for the report payload.
+    trend_ts: list[str] = []
+    trend_scores: list[int] = []
+    for ts, row in analyzed_stamped:
+        if track_range and ts is not None:
+            if min_ts is None or ts < min_ts:
+                min_ts = ts
+            if max_ts is None or ts > max_ts:
+                max_ts = ts
 
-    violation_counts: Counter[str] = Counter()
-    last_seen: dict[str, datetime] = {}
-    for row in analyzed:
-        ts = _parse_ts(str(row.get("ts", "")))
         violations = row.get("violations", [])
-        if not isinstance(violations, list):
-            continue
-        for code in violations:
-            key = str(code)
-            violation_counts[key] += 1
-            if ts is not None and (key not in last_seen or ts > last_seen[key]):
-                last_seen[key] = ts
-
-    violation_rows: list[dict[str, Any]] = []
-    for code, count in violation_counts.most_common(10):
-        row = {"code": code, "count": count, "last_seen_ts": _iso_utc(last_seen[code]) if code in last_seen else None}
-        violation_rows.append(row)
-
-    trend_points: list[dict[str, Any]] = []
-    for row in analyzed:
-        ts = row.get("ts")
+        if isinstance(violations, list):
+            for code in violations:
+                key = str(code)
+                stat = violation_stats.get(key)
+                if stat is None:
+                    violation_stats[key] = [1, ts]
+                    continue
+                stat[0] += 1
+                if ts is not None and (stat[1] is None or ts > stat[1]):
+                    stat[1] = ts
+
+        raw_ts = row.get("ts")
         score = row.get("score_total")
-        if ts is None or score is None:
+        if raw_ts is None or score is None:
             continue
         try:
-            point = {"ts": str(ts), "score": int(float(score))}
+            value = int(float(score))
         except (TypeError, ValueError):
             continue
-        trend_points.append(point)
+        trend_ts.append(str(raw_ts))
+        trend_scores.append(value)
+
+    violation_rows: list[dict[str, Any]] = []
+    for code, (count, seen) in heapq.nlargest(10, violation_stats.items(), key=lambda kv: kv[1][0]):
+        row = {"code": code, "count": count, "last_seen_ts": _iso_utc(seen) if seen is not None else None}
+        violation_rows.append(row)
+
+    trend_points = [{"ts": ts, "score": score} for ts, score in zip(trend_ts, trend_scores)]
 
     trend = {
         "score_total": {
@@ -626,32 +937,44 @@ def compute_report(
     }
 
     snapshot_status = str(latest.get("status", "unknown"))
-    hints = _build_hints(current_systems, snapshot_status=snapshot_status, include_hints=include_hints)
+    hints = _build_hints(red_non_sample, red_sample, snapshot_status=snapshot_status, include_hints=include_hints)
     top_drift_line = None
     drift_sources: list[str] = []
     if include_hints:
-        hints.extend(_sla_hints(current_systems))
+        hints.extend(_sla_hints(non_sample_rows))
         for hint in hints:
             if str(hint.get("severity", "")).lower() == "high" and hint.get("systems"):
                 hint["why"] = str(hint.get("why", "")) + _impact_suffix(g, list(hint.get("systems", [])))
 
         now_utc = now
-        contributors = _drift_contributors(registry_rows, now_utc=now_utc, registry_path=registry_path)
-        drift_hint = build_drift_hint(
-            points=trend_points,
-            rolling_avg=trend.get("rolling_avg"),
-            now_utc=now_utc,
-            contributors=contributors,
-        )
+        # Cheap precheck: contributor attribution costs 2 health computes per system,
+        # so only pay for it when the aggregate drop can actually produce a hint.
+        trend_epochs = [_ts_epoch_us(ts) for ts in trend_ts]
+        drift_scores = _series_drift_scores(trend_epochs, trend_scores, _is_ascending(trend_epochs), now_utc)
+        drift_hint = None
+        contributors_line: str | None = None
+        if drift_scores is not None and drift_scores[1] - drift_scores[0] > _DRIFT_MED_DROP:
+            contributors = _drift_contributors(
+                registry_rows, now_utc=now_utc, registry_path=registry_path, memo=health_memo, jobs=jobs
+            )
+            # Formatted once: the hint's "why" and the summary's top_drift_24h share the line.
+            contributors_line = _contributors_line(contributors) if contributors else None
+            drift_hint = build_drift_hint(
+                points=trend_points,
+                rolling_avg=trend.get("rolling_avg"),
+                now_utc=now_utc,
+                contributors=contributors,
+                scores=drift_scores,
+                top_line=contributors_line,
+            )
         if drift_hint is not None:
             systems_for_hint = list(drift_hint.get("systems", []))
             drift_hint["why"] = str(drift_hint.get("why", "")) + _impact_suffix(g, systems_for_hint)
             hints.append(drift_hint)
             drift_sources = systems_for_hint
-            if contributors:
-                top_drift_line = " | ".join(f"{sid} -{drop}" for sid, drop in contributors)
+            top_drift_line = contributors_line
 
-    sources = _select_impact_sources(current_systems=current_systems, drift_sources=drift_sources)
+    sources = _select_impact_sources(current_systems=flagged_rows, drift_sources=drift_sources)
     src, impacted = compute_impact(g, sources)
     risk_rows = _risk_scores(g, src)
     if include_hints and risk_rows:
@@ -671,21 +994,21 @@ def compute_report(
                 "owners": g.owners.get(str(top["system_id"]), []),
             }
         )
-    hints = sorted(
-        hints,
+    hints.sort(
         key=lambda h: (
-            {"high": 0, "med": 1, "low": 2}.get(str(h.get("severity", "low")).lower(), 3),
+            _SEVERITY_ORDER.get(str(h.get("severity", "low")).lower(), 3),
             str(h.get("title", "")),
         ),
     )
 
+    impacted_payload = [{"system_id": it.system_id, "distance": it.distance, "tier": it.tier} for it in impacted]
     report = {
         "report_version": "2.0",
         "summary": {
             "snapshots_analyzed": len(analyzed),
             "date_range": {
-                "min_ts": _iso_utc(min(valid_ts)) if valid_ts else None,
-                "max_ts": _iso_utc(max(valid_ts)) if valid_ts else None,
+                "min_ts": _iso_utc(min_ts) if min_ts is not None else None,
+                "max_ts": _iso_utc(max_ts) if max_ts is not None else None,
             },
             "current_status": snapshot_status,
             "current_score": float(latest.get("score_total", 0.0)) if latest else 0.0,
@@ -696,9 +1019,7 @@ def compute_report(
             "hints_count": len(hints),
             "top_drift_24h": top_drift_line,
             "sla": {
-                "thresholds_days": {
-                    k: int(v) for k, v in sorted(SLA_THRESHOLDS_DAYS.items(), key=lambda kv: kv[0])
-                }
+                "thresholds_days": {k: int(v) for k, v in sorted(SLA_THRESHOLDS_DAYS.items())},
             },
         },
         "trend": trend,
@@ -711,10 +1032,7 @@ def compute_report(
         },
         "impact": {
             "sources": src,
-            "impacted": [
-                {"system_id": it.system_id, "distance": it.distance, "tier": it.tier}
-                for it in impacted
-            ],
+            "impacted": impacted_payload,
         },
         "risk": {
             "ranked": risk_rows,
@@ -742,7 +1060,7 @@ def compute_report(
     return report
 
 
-def format_text(report: dict[str, Any], days: int) -> str:
+def format_text(report: dict[str, Any], days: int, *, now: datetime | None = None) -> str:
     summary = report["summary"]
     trend = report["trend"]
     violations = report["violations"]["top"]
@@ -750,6 +1068,8 @@ def format_text(report: dict[str, Any], days: int) -> str:
     systems_status = report["systems"]["status"]
     hints = report.get("hints", [])
 
+    if now is None:
+        now = _parse_ts(str(report.get("as_of"))) or _now_utc()
     strict_text = "PASS" if bool(summary["now_non_sample"]["strict_ready_now"]) else "FAIL"
     lines = [
         f"HEALTH REPORT ({days}d)",
@@ -767,7 +1087,8 @@ def format_text(report: dict[str, Any], days: int) -> str:
         ),
     ]
 
-    tiers = report.get("policy", {}).get("strict_blocked_tiers", []) if isinstance(report, dict) else []
+    # report is already subscripted as a dict above; no need to re-check its type.
+    tiers = report.get("policy", {}).get("strict_blocked_tiers", [])
     tiers_txt = "+".join([str(t) for t in tiers if str(t)]) if tiers else "prod"
     lines.append(f"Strict policy: {tiers_txt}")
 
@@ -779,7 +1100,7 @@ def format_text(report: dict[str, Any], days: int) -> str:
         for row in impacted_rows:
             if not isinstance(row, dict):
                 continue
-            sid = str(row.get("system_id", "")).strip()
+            sid = _sid(row)
             if not sid:
                 continue
             try:
@@ -793,7 +1114,7 @@ def format_text(report: dict[str, Any], days: int) -> str:
         lines.append(impact_line)
 
     if hints:
-        lines.extend(["", "ACTION HINTS:"])
+        lines.append("\nACTION HINTS:")
         for hint in hints[:2]:
             systems = ",".join(hint.get("systems", [])) if hint.get("systems") else "none"
             lines.extend(
@@ -805,101 +1126,94 @@ def format_text(report: dict[str, Any], days: int) -> str:
                 ]
             )
 
-    lines.extend(
-        [
-            "",
-            "Trend:",
-            (
-                f"- score_total: {trend['score_total']['start_score']:.2f} -> {trend['score_total']['end_score']:.2f} "
-                f"(D {trend['score_total']['delta']:+.2f}) | avg: {trend['rolling_avg_score']:.2f}"
-            ),
-            _trend_drift_line(
-                trend,
-                _parse_ts(str(report.get("as_of"))) or _now_utc(),
-            ),
-        ]
-    )
+    st = trend["score_total"]
+    start, end, delta, avg = st["start_score"], st["end_score"], st["delta"], trend["rolling_avg_score"]
+    lines.append("\nTrend:")
+    lines.append(f"- score_total: {start:.2f} -> {end:.2f} (D {delta:+.2f}) | avg: {avg:.2f}")
+    lines.append(_trend_drift_line(trend, now))
     if summary.get("top_drift_24h"):
         lines.append(f"Top drift (24h): {summary['top_drift_24h']}")
-    lines.extend(
-        [
-            "",
-            "Violations (count | last seen):",
-        ]
-    )
+    lines.append("\nViolations (count | last seen):")
 
     if violations:
-        for row in violations:
-            lines.append(f"- {row['code']}: {row['count']} | {row['last_seen_ts']}")
+        lines.append("\n".join(f"- {row['code']}: {row['count']} | {row['last_seen_ts']}" for row in violations))
     else:
         lines.append("- none")
 
-    lines.extend(["", "System recency (days since last event):"])
-    for row in systems_recency:
-        sample = " [sample]" if row["is_sample"] else ""
-        state = "STALE" if row["stale"] else "OK"
-        lines.append(f"- {row['system_id']}{sample}: {row['days_since_last_event']} ({state})")
+    lines.append("\nSystem recency (days since last event):")
+    if systems_recency:
+        lines.append(
+            "\n".join(
+                f"- {r['system_id']}{' [sample]' if r['is_sample'] else ''}: "
+                f"{r['days_since_last_event']} ({'STALE' if r['stale'] else 'OK'})"
+                for r in systems_recency
+            )
+        )
 
-    lines.extend(["", "System status:"])
-    for row in systems_status:
-        sample = " [sample]" if row["is_sample"] else ""
-        violations_text = ",".join(row["violations"]) if row["violations"] else "none"
-        lines.append(f"- {row['system_id']}{sample}: {row['status']} ({violations_text})")
+    lines.append("\nSystem status:")
+    if systems_status:
+        lines.append(
+            "\n".join(
+                f"- {r['system_id']}{' [sample]' if r['is_sample'] else ''}: "
+                f"{r['status']} ({','.join(r['violations'] or ['none'])})"
+                for r in systems_status
+            )
+        )
 
     return "\n".join(lines)
 
 
-def render_report_health_text(report: dict[str, Any]) -> str:
+def render_report_health_text(report: dict[str, Any], *, now: datetime | None = None) -> str:
     """
     Lightweight text renderer for tests and operator debug output.
     Accepts sparse report payloads.
     """
-    lines: list[str] = []
-
-    trend = report.get("trend", {}) if isinstance(report, dict) else {}
+    if not isinstance(report, dict):
+        report = {}
+    trend = report.get("trend", {})
     score_total = trend.get("score_total", {}) if isinstance(trend, dict) else {}
 
-    lines.append("Trend")
-    lines.append(f"Start score: {score_total.get('start_score')}")
-    lines.append(f"End score: {score_total.get('end_score')}")
-    lines.append(f"Delta: {score_total.get('delta')}")
-    lines.append(f"Rolling average: {trend.get('rolling_avg')}")
-    lines.append(_trend_drift_line(trend, _now_utc()))
-
-    return "\n".join(lines)
+    return (
+        "Trend\n"
+        f"Start score: {score_total.get('start_score')}\n"
+        f"End score: {score_total.get('end_score')}\n"
+        f"Delta: {score_total.get('delta')}\n"
+        f"Rolling average: {trend.get('rolling_avg')}\n"
+        f"{_trend_drift_line(trend, now if now is not None else _now_utc())}"
+    )
 
 
-def build_snapshot_ledger_entry(report: dict[str, Any]) -> dict[str, Any]:
-    summary = report.get("summary", {}) if isinstance(report, dict) else {}
-    policy = report.get("policy", {}) if isinstance(report, dict) else {}
-    systems_status = report.get("systems", {}).get("status", []) if isinstance(report, dict) else []
-    rows: list[dict[str, Any]] = []
-    if isinstance(systems_status, list):
-        for row in sorted(
-            [r for r in systems_status if isinstance(r, dict)],
-            key=lambda r: str(r.get("system_id", "")),
-        ):
-            rows.append(
-                {
-                    "system_id": str(row.get("system_id", "")),
-                    "status": str(row.get("status", "unknown")),
-                    "score_total": float(row.get("score_total", 0.0)),
-                    "violations": sorted([str(v) for v in (row.get("violations") or [])]),
-                    "tier": str(row.get("tier", "prod")),
-                    "is_sample": bool(row.get("is_sample", False)),
-                    "sla_status": str(row.get("sla_status", "ok")),
-                }
-            )
+def build_snapshot_ledger_entry(report: dict[str, Any], *, now: datetime | None = None) -> dict[str, Any]:
+    if not isinstance(report, dict):
+        report = {}
+    summary = report.get("summary", {})
+    policy = report.get("policy", {})
+    systems_status = report.get("systems", {}).get("status", [])
+    filtered = [r for r in systems_status if isinstance(r, dict)] if isinstance(systems_status, list) else []
+    # Coerce each field once; sort afterwards on the already-coerced system_id.
+    rows = [
+        {
+            "system_id": str(row.get("system_id", "")),
+            "status": _vocab_str(row.get("status", "unknown")),
+            "score_total": float(row.get("score_total", 0.0)),
+            "violations": sorted(map(str, row.get("violations") or ())),
+            "tier": _vocab_str(row.get("tier", "prod")),
+            "is_sample": bool(row.get("is_sample", False)),
+            "sla_status": _vocab_str(row.get("sla_status", "ok")),
+        }
+        for row in filtered
+    ]
+    rows.sort(key=itemgetter("system_id"))
     return {
-        "ts": _iso_utc(_now_utc()),
+        "ts": _iso_utc(now if now is not None else _now_utc()),
         "summary": {
-            "current_status": str(summary.get("current_status", "unknown")),
+            "current_status": _vocab_str(summary.get("current_status", "unknown")),
             "current_score": float(summary.get("current_score", 0.0)),
             "now_non_sample": summary.get("now_non_sample", {}),
             "strict_ready_now": bool(summary.get("strict_ready_now", False)),
         },
         "policy": {
-            "strict_blocked_tiers": sorted([str(x) for x in policy.get("strict_blocked_tiers", ["prod"])]),
+            "strict_blocked_tiers": sorted(map(str, policy.get("strict_blocked_tiers", ("prod",)))),
             "include_staging": bool(policy.get("include_staging", False)),
             "include_dev": bool(policy.get("include_dev", False)),
             "enforce_sla": bool(policy.get("enforce_sla", False)),
@@ -909,9 +1223,4 @@ def build_snapshot_ledger_entry(report: dict[str, Any]) -> dict[str, Any]:
 
 
 def write_snapshot_ledger(report: dict[str, Any], path: str | Path | None = None) -> Path:
-    ledger_path = Path(path) if path is not None else Path("data/snapshots/report_snapshot_history.jsonl")
-    ledger_path.parent.mkdir(parents=True, exist_ok=True)
-    entry = build_snapshot_ledger_entry(report)
-    with ledger_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, sort_keys=True) + "\n")
-    return ledger_path
+    return append_ledger_entries((build_snapshot_ledger_entry(report),), path)
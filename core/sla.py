@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 
 SLA_THRESHOLDS_DAYS = {
@@ -10,30 +11,42 @@ SLA_THRESHOLDS_DAYS = {
     "sample": 9999,
 }
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
 
-def _as_utc(dt: datetime) -> datetime:
+
+def _epoch_us(dt: datetime) -> int:
+    # Exact integer microseconds since epoch; naive inputs are treated as UTC.
     if dt.tzinfo is None:
-        return dt.replace(tzinfo=UTC)
-    return dt.astimezone(UTC)
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - _EPOCH) // _ONE_US
 
 
-def _parse_ts(value: datetime | str | None) -> datetime | None:
+def _parse_epoch_us(value: datetime | str | None) -> int | None:
     if value is None:
         return None
     if isinstance(value, datetime):
-        return _as_utc(value)
+        return _epoch_us(value)
     if not isinstance(value, str) or not value.strip():
         return None
+    return _parse_epoch_us_str(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_epoch_us_str(value: str) -> int | None:
+    # Recency rows repeat the same few ISO strings across reports; parse each once.
     normalized = value.replace("Z", "+00:00")
     try:
         parsed = datetime.fromisoformat(normalized)
     except ValueError:
         return None
-    return _as_utc(parsed)
+    return _epoch_us(parsed)
 
 
 def tier_threshold_days(tier: str) -> int:
-    return int(SLA_THRESHOLDS_DAYS.get(str(tier), SLA_THRESHOLDS_DAYS["prod"]))
+    # Read SLA_THRESHOLDS_DAYS on every call so updates to the mapping take effect.
+    return int(SLA_THRESHOLDS_DAYS.get(tier if isinstance(tier, str) else str(tier), SLA_THRESHOLDS_DAYS["prod"]))
 
 
 def sla_status(last_event_ts: datetime | str | None, tier: str, as_of: datetime) -> str:
@@ -45,9 +58,9 @@ def sla_status(last_event_ts: datetime | str | None, tier: str, as_of: datetime)
       - "breach" when last_event_ts exists and age > threshold
       - "unknown" when last_event_ts is missing/unparsable
     """
-    as_of_utc = _as_utc(as_of)
-    last_utc = _parse_ts(last_event_ts)
-    if last_utc is None:
+    last_us = _parse_epoch_us(last_event_ts)
+    if last_us is None:
         return "unknown"
-    age_days = max(0.0, (as_of_utc - last_utc).total_seconds() / 86400.0)
-    return "breach" if age_days > float(tier_threshold_days(tier)) else "ok"
+    # Integer microsecond ages: same verdict as comparing fractional days, without datetime math.
+    age_us = _epoch_us(as_of) - last_us
+    return "breach" if age_us > tier_threshold_days(tier) * _US_PER_DAY else "ok"
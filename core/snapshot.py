@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import time
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 DEFAULT_LEDGER_PATH = "data/snapshots/report_snapshot_history.jsonl"
+# Shared codec: json.loads re-checks its arguments per call and json.dumps(sort_keys=True)
+# builds a fresh encoder per call; the ledger paths reuse one of each.
+_json_decode = json.JSONDecoder().decode
+_ENTRY_ENCODER = json.JSONEncoder(sort_keys=True)
+_TAIL_CHUNK_BYTES = 64 * 1024
+_TS_MEMBER = '"ts": "'
+_TOP_COUNTS = 50
 
 
 def _utcnow() -> datetime:
@@ -16,6 +28,11 @@ def _utcnow() -> datetime:
 
 def _parse_iso_utc(ts: str) -> datetime | None:
     # Accepts Z or offset forms; mirrors your core/events behavior.
+    try:
+        # 3.11+ parses the ledger's trailing "Z" natively; the rewrite below is the fallback.
+        return datetime.fromisoformat(ts)
+    except Exception:
+        pass
     try:
         s = ts.strip()
         if s.endswith("Z"):
@@ -25,35 +42,117 @@ def _parse_iso_utc(ts: str) -> datetime | None:
         return None
 
 
-def _read_jsonl(path: Path, tail: int | None = None) -> list[dict[str, Any]]:
+def _decode_line(line: str) -> dict[str, Any] | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        obj = _json_decode(line)
+    except Exception:
+        # tolerate bad lines, keep deterministic behavior
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _decode_lines(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    for line in lines:
+        obj = _decode_line(line)
+        if obj is not None:
+            yield obj
+
+
+def _iter_lines(path: Path) -> Iterator[str]:
+    # Streams the file line by line, so a full scan holds one line in memory, not the file.
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as f:
+        yield from f
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    yield from _decode_lines(_iter_lines(path))
+
+
+def _trailing_ts(line: str) -> datetime | None:
+    """
+    Top-level ts of a ledger line, read off the end of the line without decoding the row.
+    write_snapshot_ledger sorts keys, so ts is the last member and the line ends `"ts": "<value>"}`;
+    any other shape returns None and the caller decodes the line as usual.
+    """
+    line = line.rstrip()
+    if not line.endswith('"}'):
+        return None
+    i = line.rfind(_TS_MEMBER)
+    # An unescaped opening quote (after "{" or ", ") makes this a key of the outermost object.
+    if i <= 0 or line[i - 1] not in "{ ":
+        return None
+    value = line[i + len(_TS_MEMBER) : -2]
+    if '"' in value or "\\" in value:
+        return None
+    return _parse_iso_utc(value)
+
+
+def _reverse_lines(path: Path) -> Iterator[bytes]:
+    """Raw lines newest-first, read backward from EOF in fixed-size chunks."""
+    carry = b""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        at_eof = True
+        while pos > 0:
+            step = min(_TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + carry).split(b"\n")
+            if at_eof:
+                # A final newline ends the last line; it does not start an empty one.
+                if parts[-1] == b"":
+                    parts.pop()
+                at_eof = False
+            # The first piece may be the tail of a line that starts in an earlier chunk.
+            carry = parts.pop(0) if pos > 0 else b""
+            yield from reversed(parts)
+
+
+def _tail_lines(path: Path, n: int) -> list[str]:
+    # Last n lines, blank ones included, so tails count lines the way splitlines() would.
+    rev = list(islice(_reverse_lines(path), n))
+    return [raw.decode("utf-8") for raw in reversed(rev)]
+
+
+def read_jsonl(path: Path, tail: int | None = None) -> list[dict[str, Any]]:
+    """Object rows of a JSONL file in file order; the last `tail` non-blank lines when tail > 0."""
+    if tail is None or tail <= 0:
+        return list(_iter_jsonl(path))
     if not path.exists():
         return []
-    lines = path.read_text(encoding="utf-8").splitlines()
-    if tail is not None and tail > 0:
-        lines = lines[-tail:]
-    out: list[dict[str, Any]] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-            if isinstance(obj, dict):
-                out.append(obj)
-        except Exception:
-            # tolerate bad lines, keep deterministic behavior
-            continue
-    return out
+    # Append-only ledger: only the bytes holding the last `tail` lines are read.
+    return list(_decode_lines(_tail_lines(path, tail)))
+
+
+def _reason_key(r: dict[str, Any]) -> tuple[str, str, str]:
+    return (
+        str(r.get("reason_code", "")),
+        str(r.get("tier", "")),
+        str(r.get("system_id", "")),
+    )
+
+
+def _system_id_key(r: dict[str, Any]) -> str:
+    return str(r.get("system_id", ""))
+
+
+def _reason_item_key(item: tuple[tuple, int]) -> tuple[int, str, str]:
+    (_, rc, tier), count = item
+    return (-count, rc, tier)
+
+
+def _system_reason_item_key(item: tuple[tuple, int]) -> tuple[int, str, str, str]:
+    (_, sysid, rc, tier), count = item
+    return (-count, sysid, rc, tier)
 
 
 def _sorted_reasons(reasons: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    def key(r: dict[str, Any]) -> tuple[str, str, str]:
-        return (
-            str(r.get("reason_code", "")),
-            str(r.get("tier", "")),
-            str(r.get("system_id", "")),
-        )
-    return sorted(reasons, key=key)
+    return sorted(reasons, key=_reason_key)
 
 
 def _policy_key(policy: dict[str, Any]) -> tuple:
@@ -87,10 +186,7 @@ def build_snapshot_ledger_entry(report: dict[str, Any]) -> dict[str, Any]:
 
     rows: list[dict[str, Any]] = []
     if isinstance(systems_status, list):
-        for row in sorted(
-            [r for r in systems_status if isinstance(r, dict)],
-            key=lambda r: str(r.get("system_id", "")),
-        ):
+        for row in sorted([r for r in systems_status if isinstance(r, dict)], key=_system_id_key):
             rows.append(
                 {
                     "system_id": str(row.get("system_id", "")),
@@ -131,15 +227,37 @@ def build_snapshot_ledger_entry(report: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def write_snapshot_ledger(report: dict[str, Any], path: str | Path | None = None) -> Path:
+def append_ledger_entries(entries: Iterable[dict[str, Any]], path: str | Path | None = None) -> Path:
+    """Append already-built entries to the ledger, one encoded line each, with a single write."""
     ledger_path = Path(path) if path is not None else Path(DEFAULT_LEDGER_PATH)
-    ledger_path.parent.mkdir(parents=True, exist_ok=True)
-    entry = build_snapshot_ledger_entry(report)
-    with ledger_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, sort_keys=True) + "\n")
+    payload = "".join(_ENTRY_ENCODER.encode(entry) + "\n" for entry in entries)
+    if payload:
+        # Raw O_APPEND fd: every line of the call goes to the kernel in one write(2), so lines
+        # from concurrent writers land whole instead of interleaving through a text buffer.
+        data = memoryview(payload.encode("utf-8"))
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            fd = os.open(ledger_path, flags, 0o666)
+        except FileNotFoundError:
+            ledger_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(ledger_path, flags, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
     return ledger_path
 
 
+def write_snapshot_ledger(report: dict[str, Any], path: str | Path | None = None) -> Path:
+    return append_ledger_entries((build_snapshot_ledger_entry(report),), path)
+
+
+def write_snapshot_ledger_batch(reports: Iterable[dict[str, Any]], path: str | Path | None = None) -> Path:
+    """Append one ledger line per report with a single open + write."""
+    return append_ledger_entries((build_snapshot_ledger_entry(report) for report in reports), path)
+
+
 def tail_snapshots(
     ledger_path: str | Path,
     *,
@@ -147,21 +265,33 @@ def tail_snapshots(
     since_hours: int | None = None,
 ) -> list[dict[str, Any]]:
     p = Path(ledger_path)
-    rows = _read_jsonl(p, tail=max(1, n * 5))  # read a bit more to allow since filtering
-    # filter by since
+    cutoff = None
     if since_hours is not None and since_hours > 0:
         cutoff = _utcnow() - timedelta(hours=since_hours)
-        filtered: list[dict[str, Any]] = []
-        for r in rows:
-            ts = r.get("ts")
-            dt = _parse_iso_utc(str(ts)) if ts is not None else None
-            if dt is None:
+    newest_first: list[dict[str, Any]] = []
+    if p.exists():
+        # Walk the last n*5 lines (a bit more than n, to allow since filtering) newest-first and
+        # stop once n rows qualify; the older lines in that window are never decoded.
+        for raw in islice(_reverse_lines(p), max(1, n * 5)):
+            line = raw.decode("utf-8")
+            if cutoff is not None:
+                line_dt = _trailing_ts(line)
+                if line_dt is not None and line_dt < cutoff:
+                    continue
+            r = _decode_line(line)
+            if r is None:
                 continue
-            if dt >= cutoff:
-                filtered.append(r)
-        rows = filtered
+            # filter by since
+            if cutoff is not None:
+                ts = r.get("ts")
+                dt = _parse_iso_utc(str(ts)) if ts is not None else None
+                if dt is None or dt < cutoff:
+                    continue
+            newest_first.append(r)
+            if len(newest_first) == n:
+                break
     # take last n (chronological stability)
-    rows = rows[-n:]
+    rows = newest_first[::-1][-n:]
     # normalize strict_failure ordering for determinism
     for r in rows:
         sf = r.get("strict_failure")
@@ -188,45 +318,37 @@ def compute_stats(
     days: int = 7,
 ) -> dict[str, Any]:
     p = Path(ledger_path)
-    rows = _read_jsonl(p, tail=None)
-    if not rows:
-        now = _utcnow().isoformat().replace("+00:00", "Z")
-        empty: SnapshotStats = SnapshotStats(
-            days=days,
-            window_start=now,
-            window_end=now,
-            total=0,
-            strict_ready_rate=0.0,
-            status_counts={"green": 0, "yellow": 0, "red": 0, "unknown": 0},
-            reason_counts=[],
-            system_reason_counts=[],
-        )
-        return _stats_to_dict(empty)
-
     end = _utcnow()
     start = end - timedelta(days=days)
 
-    windowed: list[dict[str, Any]] = []
-    for r in rows:
+    seen_rows = False
+    status_counts = {"green": 0, "yellow": 0, "red": 0, "unknown": 0}
+    strict_ready_true = 0
+    total = 0
+    # Status and readiness counts are order-free, so they are taken during the scan; only the
+    # (ts, strict_failure) pairs needed for ordered reason counting outlive their row.
+    failures: list[tuple[str, dict[str, Any]]] = []
+    for line in _iter_lines(p):
+        # Rows are appended in time order, so most of a long ledger sits before the window;
+        # those rows are rejected on their trailing ts without being decoded.
+        line_dt = _trailing_ts(line)
+        if line_dt is not None and not start <= line_dt <= end:
+            # Only a quiet window vs an empty ledger still needs one such row to be decoded.
+            if not seen_rows:
+                seen_rows = _decode_line(line) is not None
+            continue
+        r = _decode_line(line)
+        if r is None:
+            continue
+        seen_rows = True
         ts = r.get("ts")
         dt = _parse_iso_utc(str(ts)) if ts is not None else None
         if dt is None:
             continue
-        if start <= dt <= end:
-            windowed.append(r)
-
-    # deterministic chronological order
-    windowed.sort(key=lambda r: str(r.get("ts", "")))
-
-    status_counts = {"green": 0, "yellow": 0, "red": 0, "unknown": 0}
-    strict_ready_true = 0
-    total = len(windowed)
-
-    # reason counts
-    reason_counter: dict[tuple, int] = {}
-    system_reason_counter: dict[tuple, int] = {}
+        if not start <= dt <= end:
+            continue
+        total += 1
 
-    for r in windowed:
         summary = r.get("summary", {})
         if isinstance(summary, dict):
             strict_now = bool(summary.get("strict_ready_now", False))
@@ -242,47 +364,70 @@ def compute_stats(
 
         sf = r.get("strict_failure")
         if isinstance(sf, dict):
-            policy = sf.get("policy", {})
-            policy_tuple = _policy_key(policy if isinstance(policy, dict) else {})
-            reasons = sf.get("reasons", [])
-            if isinstance(reasons, list):
-                for rr in _sorted_reasons([x for x in reasons if isinstance(x, dict)]):
-                    rc = str(rr.get("reason_code", ""))
-                    tier = str(rr.get("tier", ""))
-                    sysid = str(rr.get("system_id", ""))
-                    k = (policy_tuple, rc, tier)
-                    reason_counter[k] = reason_counter.get(k, 0) + 1
-                    k2 = (policy_tuple, sysid, rc, tier)
-                    system_reason_counter[k2] = system_reason_counter.get(k2, 0) + 1
+            failures.append((str(ts), sf))
+
+    if not seen_rows:
+        now = end.isoformat().replace("+00:00", "Z")
+        empty: SnapshotStats = SnapshotStats(
+            days=days,
+            window_start=now,
+            window_end=now,
+            total=0,
+            strict_ready_rate=0.0,
+            status_counts={"green": 0, "yellow": 0, "red": 0, "unknown": 0},
+            reason_counts=[],
+            system_reason_counts=[],
+        )
+        return _stats_to_dict(empty)
+
+    # deterministic chronological order (stable, so equal ts keep file order)
+    failures.sort(key=itemgetter(0))
+
+    # reason counts
+    reason_counter: Counter[tuple] = Counter()
+    system_reason_counter: Counter[tuple] = Counter()
+
+    for _, sf in failures:
+        policy = sf.get("policy", {})
+        policy_tuple = _policy_key(policy if isinstance(policy, dict) else {})
+        reasons = sf.get("reasons", [])
+        if isinstance(reasons, list):
+            # No per-row sort needed: counts are order-free, and every key in a row shares its
+            # policy, so first-seen order across policies (the only tie left) is unchanged.
+            triples = [
+                (str(rr.get("reason_code", "")), str(rr.get("tier", "")), str(rr.get("system_id", "")))
+                for rr in reasons
+                if isinstance(rr, dict)
+            ]
+            reason_counter.update((policy_tuple, rc, tier) for rc, tier, _ in triples)
+            system_reason_counter.update((policy_tuple, sysid, rc, tier) for rc, tier, sysid in triples)
 
     strict_ready_rate = (strict_ready_true / total) if total else 0.0
 
-    reason_counts = []
-    for (policy_tuple, rc, tier), c in reason_counter.items():
-        reason_counts.append(
-            {
-                "count": c,
-                "reason_code": rc,
-                "tier": tier,
-                "policy": _policy_tuple_to_dict(policy_tuple),
-            }
-        )
-    reason_counts.sort(key=lambda d: (-int(d["count"]), str(d["reason_code"]), str(d["tier"])))
-
-    system_reason_counts = []
-    for (policy_tuple, sysid, rc, tier), c in system_reason_counter.items():
-        system_reason_counts.append(
-            {
-                "count": c,
-                "system_id": sysid,
-                "reason_code": rc,
-                "tier": tier,
-                "policy": _policy_tuple_to_dict(policy_tuple),
-            }
+    # Rank the (key, count) items and only materialize the top entries, policy dicts included;
+    # nsmallest matches sorted()[:n], ties keeping first-seen order.
+    reason_counts = [
+        {
+            "count": c,
+            "reason_code": rc,
+            "tier": tier,
+            "policy": _policy_tuple_to_dict(policy_tuple),
+        }
+        for (policy_tuple, rc, tier), c in heapq.nsmallest(_TOP_COUNTS, reason_counter.items(), key=_reason_item_key)
+    ]
+
+    system_reason_counts = [
+        {
+            "count": c,
+            "system_id": sysid,
+            "reason_code": rc,
+            "tier": tier,
+            "policy": _policy_tuple_to_dict(policy_tuple),
+        }
+        for (policy_tuple, sysid, rc, tier), c in heapq.nsmallest(
+            _TOP_COUNTS, system_reason_counter.items(), key=_system_reason_item_key
         )
-    system_reason_counts.sort(
-        key=lambda d: (-int(d["count"]), str(d["system_id"]), str(d["reason_code"]), str(d["tier"]))
-    )
+    ]
 
     stats = SnapshotStats(
         days=days,
@@ -291,15 +436,15 @@ def compute_stats(
         total=total,
         strict_ready_rate=float(round(strict_ready_rate, 4)),
         status_counts=status_counts,
-        reason_counts=reason_counts[:50],
-        system_reason_counts=system_reason_counts[:50],
+        reason_counts=reason_counts,
+        system_reason_counts=system_reason_counts,
     )
     return _stats_to_dict(stats)
 
 
 def read_jsonl_tail(*, ledger_path: str | Path, n: int) -> list[dict[str, Any]]:
     tail = int(max(1, n))
-    return _read_jsonl(Path(ledger_path), tail=tail)
+    return read_jsonl(Path(ledger_path), tail=tail)
 
 
 def snapshot_stats(*, ledger_path: str | Path, days: int) -> dict[str, Any]:
@@ -317,9 +462,16 @@ def snapshot_stats(*, ledger_path: str | Path, days: int) -> dict[str, Any]:
     cutoff = _utcnow() - timedelta(days=max(0, int(days)))
     total = 0
     strict_failures = 0
-    reason_codes: dict[str, int] = {}
+    reason_codes: Counter[str] = Counter()
 
-    for row in _read_jsonl(p, tail=None):
+    for line in _iter_lines(p):
+        # Rows older than the cutoff are rejected on their trailing ts without being decoded.
+        line_dt = _trailing_ts(line)
+        if line_dt is not None and line_dt < cutoff:
+            continue
+        row = _decode_line(line)
+        if row is None:
+            continue
         ts = row.get("ts")
         dt = _parse_iso_utc(str(ts)) if ts is not None else None
         if dt is not None and dt < cutoff:
@@ -331,11 +483,7 @@ def snapshot_stats(*, ledger_path: str | Path, days: int) -> dict[str, Any]:
             strict_failures += 1
             reasons = sf.get("reasons")
             if isinstance(reasons, list):
-                for r in reasons:
-                    if not isinstance(r, dict):
-                        continue
-                    code = str(r.get("reason_code", "UNKNOWN"))
-                    reason_codes[code] = reason_codes.get(code, 0) + 1
+                reason_codes.update(str(r.get("reason_code", "UNKNOWN")) for r in reasons if isinstance(r, dict))
 
     return {
         "stats_version": "1.0",
@@ -343,7 +491,8 @@ def snapshot_stats(*, ledger_path: str | Path, days: int) -> dict[str, Any]:
         "days": int(days),
         "rows": total,
         "strict_failures": strict_failures,
-        "reason_codes": dict(sorted(reason_codes.items(), key=lambda kv: kv[0])),
+        # Codes are unique, so item tuples order by code alone; no key function needed.
+        "reason_codes": dict(sorted(reason_codes.items())),
     }
 
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from core.events import parse_iso_utc
+from core.snapshot import read_jsonl
 
 _STATUS_RANK = {"missing": -1, "unknown": 0, "green": 1, "yellow": 2, "red": 3}
 _HIGH_VIOLATION_CODES = {"PRIMITIVES_MIN", "INVARIANTS_MIN"}
@@ -22,25 +23,8 @@ def _iter_ledger_rows(ledger_path: Path, tail: int) -> list[dict[str, Any]]:
     Read up to last N JSONL rows. Deterministic: preserves file order for those rows.
     Tolerant of bad lines.
     """
-    if not ledger_path.exists():
-        return []
-
-    lines = ledger_path.read_text(encoding="utf-8").splitlines()
-    if tail > 0:
-        lines = lines[-tail:]
-
-    out: list[dict[str, Any]] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-            if isinstance(obj, dict):
-                out.append(obj)
-        except Exception:
-            continue
-    return out
+    # Same reader as the snapshot ledger: tails are read backward from EOF.
+    return read_jsonl(ledger_path, tail=tail)
 
 
 def _effective_row_time(row: dict[str, Any]) -> datetime | None:
@@ -81,11 +65,28 @@ def _select_by_index(rows: list[dict[str, Any]], idx: int) -> dict[str, Any] | N
         return None
 
 
-def _select_by_ts(rows: list[dict[str, Any]], ts: str) -> dict[str, Any] | None:
-    # exact match first
+def _ts_index(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    # First row per exact ts string, the same row the linear exact-match scan would return.
+    index: dict[str, dict[str, Any]] = {}
     for r in rows:
-        if str(r.get("ts", "")) == ts:
-            return r
+        index.setdefault(str(r.get("ts", "")), r)
+    return index
+
+
+def _select_by_ts(
+    rows: list[dict[str, Any]],
+    ts: str,
+    by_ts: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any] | None:
+    # exact match first
+    if by_ts is not None:
+        hit = by_ts.get(ts)
+        if hit is not None:
+            return hit
+    else:
+        for r in rows:
+            if str(r.get("ts", "")) == ts:
+                return r
     # else attempt datetime equality (same instant)
     target = parse_iso_utc(ts)
     if target is None:
@@ -97,7 +98,11 @@ def _select_by_ts(rows: list[dict[str, Any]], ts: str) -> dict[str, Any] | None:
     return None
 
 
-def _resolve_ref(rows: list[dict[str, Any]], ref: str) -> dict[str, Any] | None:
+def _resolve_ref(
+    rows: list[dict[str, Any]],
+    ref: str,
+    by_ts: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any] | None:
     ref = ref.strip()
     if not ref:
         return None
@@ -115,7 +120,7 @@ def _resolve_ref(rows: list[dict[str, Any]], ref: str) -> dict[str, Any] | None:
         pass
 
     # timestamp
-    return _select_by_ts(rows, ref)
+    return _select_by_ts(rows, ref, by_ts)
 
 
 def _systems_map(entry: dict[str, Any]) -> dict[str, dict[str, Any]]:
@@ -161,17 +166,18 @@ def _strict_reasons(entry: dict[str, Any]) -> list[dict[str, Any]]:
     return reasons if isinstance(reasons, list) else []
 
 
+def _reason_key(r: dict[str, Any]) -> tuple[str, str, str]:
+    return (
+        str(r.get("system_id", "")),
+        str(r.get("tier", "")),
+        str(r.get("reason_code", "")),
+    )
+
+
 def _new_strict_reasons(a_entry: dict[str, Any], b_entry: dict[str, Any]) -> list[dict[str, Any]]:
     a_reasons = _strict_reasons(a_entry)
     b_reasons = _strict_reasons(b_entry)
 
-    def _reason_key(r: dict[str, Any]) -> tuple[str, str, str]:
-        return (
-            str(r.get("system_id", "")),
-            str(r.get("tier", "")),
-            str(r.get("reason_code", "")),
-        )
-
     a_keys = {_reason_key(r) for r in a_reasons if isinstance(r, dict)}
     out: list[dict[str, Any]] = []
     for r in b_reasons:
@@ -180,13 +186,7 @@ def _new_strict_reasons(a_entry: dict[str, Any], b_entry: dict[str, Any]) -> lis
         if _reason_key(r) not in a_keys:
             out.append(r)
 
-    out.sort(
-        key=lambda r: (
-            str(r.get("system_id", "")),
-            str(r.get("tier", "")),
-            str(r.get("reason_code", "")),
-        )
-    )
+    out.sort(key=_reason_key)
     return out
 
 
@@ -402,8 +402,10 @@ def snapshot_diff_from_ledger(
     if not rows:
         return {"error": "NO_LEDGER_ROWS", "ledger": str(ledger_path)}
 
-    a_entry = _resolve_ref(rows, a)
-    b_entry = _resolve_ref(rows, b)
+    # One ts index serves both refs; the instant-equality scan only runs on an exact miss.
+    by_ts = _ts_index(rows)
+    a_entry = _resolve_ref(rows, a, by_ts)
+    b_entry = _resolve_ref(rows, b, by_ts)
     if a_entry is None or b_entry is None:
         return {
             "error": "BAD_REF",
@@ -17,9 +17,13 @@ def parse_iso_utc(ts: str) -> Optional[datetime]:
         s = str(ts).strip()
         if not s:
             return None
-        if s.endswith("Z"):
-            s = s[:-1] + "+00:00"
-        dt = datetime.fromisoformat(s)
+        try:
+            # 3.11+ parses a trailing "Z" natively; rewrite only for forms it rejects.
+            dt = datetime.fromisoformat(s)
+        except ValueError:
+            if not s.endswith("Z"):
+                raise
+            dt = datetime.fromisoformat(s[:-1] + "+00:00")
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
@@ -106,6 +106,70 @@ def test_compute_report_delta_frequency_and_strict_ready(tmp_path: Path, monkeyp
     assert top["INVARIANTS_MIN"] == 1
 
 
+def test_compute_report_windows_sorted_and_unsorted_history_alike(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    bootstrap_repo()
+
+    as_of = datetime(2026, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
+    rows = [
+        {"ts": "2026-01-01T00:00:00Z", "status": "green", "score_total": 10.0, "violations": []},
+        {"ts": "2026-02-10T00:00:00Z", "status": "green", "score_total": 80.0, "violations": []},
+        {"ts": "2026-02-12T00:00:00Z", "status": "green", "score_total": 90.0, "violations": []},
+        {"ts": "2026-02-20T00:00:00Z", "status": "red", "score_total": 0.0, "violations": []},
+    ]
+
+    _write_history(tmp_path, rows)
+    in_order = compute_report(days=7, tail=2000, as_of=as_of)
+    _write_history(tmp_path, [rows[2], rows[0], rows[3], rows[1]])
+    shuffled = compute_report(days=7, tail=2000, as_of=as_of)
+
+    for report in (in_order, shuffled):
+        assert report["summary"]["snapshots_analyzed"] == 2
+        assert report["summary"]["date_range"]["min_ts"] == "2026-02-10T00:00:00Z"
+        assert report["summary"]["date_range"]["max_ts"] == "2026-02-12T00:00:00Z"
+        assert report["trend"]["rolling_avg_score"] == 85.0
+
+
+def test_load_history_tail_from_end_matches_forward_read(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "health_history.jsonl"
+    lines = [json.dumps({"ts": f"2026-02-{day:02d}T00:00:00Z", "score_total": float(day)}) for day in range(1, 21)]
+    lines[14] = "{not json"
+    lines.insert(10, "   ")
+    # Blank only to str.strip(): the backward reader must drop it like the forward one.
+    lines.insert(len(lines) - 1, "\u00a0\x1c\x85")
+    path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+    expected = {tail: reporting.load_history(tail=tail, path=path) for tail in (1, 3, 8, 50)}
+
+    # Force the backward reader with chunk sizes that split lines mid-record.
+    monkeypatch.setattr(reporting, "_TAIL_SEEK_MIN_BYTES", 0)
+    for chunk in (7, 64, 1 << 16):
+        monkeypatch.setattr(reporting, "_TAIL_CHUNK_BYTES", chunk)
+        for tail, rows in expected.items():
+            assert reporting.load_history(tail=tail, path=path) == rows
+
+    assert [row["score_total"] for row in expected[3]] == [18.0, 19.0, 20.0]
+    assert len(expected[50]) == 19
+
+
+def test_load_history_rejects_lines_invalid_on_their_own(tmp_path: Path) -> None:
+    path = tmp_path / "health_history.jsonl"
+    path.write_text(
+        '{"ts": "2026-02-01T00:00:00Z", "score_total": 1.0}\n'
+        '{"ts": "2026-02-02T00:00:00Z"},{"ts": "2026-02-03T00:00:00Z"}\n'
+        '{"ts": "2026-02-05T00:00:00Z", "score_total": 5.0}\n',
+        encoding="utf-8",
+    )
+
+    rows = reporting.load_history(tail=10, path=path)
+
+    assert [row["ts"] for row in rows] == ["2026-02-01T00:00:00Z", "2026-02-05T00:00:00Z"]
+
+    # Each line is invalid alone, but joined they form a valid three-element array.
+    path.write_text('{"a":"}\n{"}\n{"c":1},{"d":2}\n', encoding="utf-8")
+    assert reporting.load_history(tail=10, path=path) == []
+
+
 def test_hints_high_for_non_sample_red_violations(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     bootstrap_repo()
@@ -212,6 +276,11 @@ def test_report_no_hints_flag_disables_hints_json_and_text(tmp_path: Path, monke
     assert payload["hints"] == []
 
 
+def test_report_health_rejects_jobs_below_one(capsys) -> None:
+    assert app_main(["report", "health", "--jobs", "0"]) == 1
+    assert "must be >= 1" in capsys.readouterr().err
+
+
 def test_report_snapshot_diff_command_outputs_json(tmp_path: Path, monkeypatch, capsys) -> None:
     monkeypatch.chdir(tmp_path)
     bootstrap_repo()
@@ -405,6 +474,35 @@ def test_drift_hint_high_if_drop_gt_20() -> None:
     assert hint["severity"] == "high"
 
 
+def test_score_at_or_before_respects_subsecond_boundary() -> None:
+    target = datetime(2026, 2, 13, 12, 0, 0, tzinfo=timezone.utc)
+    points = [
+        {"ts": "2026-02-13T11:59:59.999999Z", "score": 90},
+        {"ts": "2026-02-13T12:00:00.500000Z", "score": 80},
+    ]
+    assert reporting._score_at_or_before(points, target) == 90
+    assert reporting._score_at_or_before(points, target + timedelta(seconds=1)) == 80
+    assert reporting._score_at_or_before(points, target - timedelta(seconds=1)) is None
+
+
+def test_score_at_or_before_handles_ties_and_unsorted_points() -> None:
+    target = datetime(2026, 2, 13, 12, 0, 0, tzinfo=timezone.utc)
+    tied = [
+        {"ts": "2026-02-12T00:00:00Z", "score": 50},
+        {"ts": "2026-02-13T00:00:00Z", "score": 60},
+        {"ts": "2026-02-13T00:00:00Z", "score": 65},
+        {"ts": "2026-02-14T00:00:00Z", "score": 70},
+        {"ts": None, "score": 99},
+    ]
+    assert reporting._score_at_or_before(tied, target) == 60
+
+    unsorted = [tied[3], tied[0], tied[1]]
+    assert reporting._score_at_or_before(unsorted, target) == 60
+
+    # Target past the last point: the tie run at the end still resolves to its first point.
+    assert reporting._score_at_or_before(tied[:3], target) == 60
+
+
 def test_compute_report_includes_drift_hint_in_full_output(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     bootstrap_repo()
@@ -436,6 +534,31 @@ def test_compute_report_includes_drift_hint_in_full_output(tmp_path: Path, monke
     assert report["summary"]["hints_count"] == len(report["hints"])
 
 
+def test_compute_report_skips_drift_contributors_without_drop(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    bootstrap_repo()
+
+    now = datetime(2026, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(reporting, "_now_utc", lambda: now)
+
+    def fail_drift_contributors(*_args, **_kwargs):
+        raise AssertionError("_drift_contributors must not run without a drift drop")
+
+    monkeypatch.setattr(reporting, "_drift_contributors", fail_drift_contributors)
+    _write_history(
+        tmp_path,
+        [
+            {"ts": "2026-02-13T12:00:00Z", "status": "green", "score_total": 90.0, "violations": []},
+            {"ts": "2026-02-14T12:00:00Z", "status": "green", "score_total": 85.0, "violations": []},
+        ],
+    )
+
+    report = compute_report(days=30, tail=2000, strict=False)
+
+    assert "Health drift detected" not in {h["title"] for h in report["hints"]}
+    assert report["summary"]["top_drift_24h"] is None
+
+
 def test_text_report_includes_drift_line(monkeypatch) -> None:
     from datetime import datetime, timezone
     import core.reporting as r
@@ -495,6 +618,100 @@ def test_drift_contributors_uses_cache_for_duplicate_rows(monkeypatch) -> None:
     assert len(calls) == 2
 
 
+def test_system_recency_scans_shared_events_glob_once(monkeypatch) -> None:
+    from core.registry import SystemSpec
+
+    last = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    calls: list[str] = []
+
+    def fake_last_event_ts_from_glob(events_glob: str, registry_path=None, *, as_of=None):
+        calls.append(events_glob)
+        return last
+
+    monkeypatch.setattr(reporting, "last_event_ts_from_glob", fake_last_event_ts_from_glob)
+    specs = [
+        SystemSpec(system_id="a-sys", contracts_glob="c/a-*.json", events_glob="data/logs/shared.jsonl"),
+        SystemSpec(system_id="b-sys", contracts_glob="c/b-*.json", events_glob="data/logs/shared.jsonl"),
+    ]
+
+    rows = reporting._system_recency(None, as_of=last + timedelta(days=2), specs=specs)
+
+    assert calls == ["data/logs/shared.jsonl"]
+    assert [(r["system_id"], r["days_since_last_event"]) for r in rows] == [("a-sys", 2), ("b-sys", 2)]
+
+
+def test_replay_report_reuses_as_of_health_in_drift_attribution(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    bootstrap_repo()
+    upsert_system("good-sys", "data/contracts/good-sys-*.json", "data/logs/good-sys-events.jsonl")
+
+    replay_at = datetime(2026, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
+    calls: list[tuple[str, object]] = []
+
+    def fake_compute_health_for_system(system_id: str, contracts_glob: str, events_glob: str, *, as_of=None, registry_path=None):
+        calls.append((system_id, as_of))
+        return {"status": "green", "violations": [], "score_total": 95.0 if as_of < replay_at else 70.0}
+
+    monkeypatch.setattr(reporting, "compute_health_for_system", fake_compute_health_for_system)
+    _write_history(
+        tmp_path,
+        [
+            {"ts": "2026-02-13T12:00:00Z", "status": "green", "score_total": 95.0, "violations": []},
+            {"ts": "2026-02-14T12:00:00Z", "status": "yellow", "score_total": 70.0, "violations": []},
+        ],
+    )
+
+    report = compute_report(days=30, tail=2000, as_of=replay_at)
+
+    assert report["summary"]["top_drift_24h"] == "good-sys -25"
+    # "now" health is computed once and shared by current status + drift attribution.
+    good_calls = [stamp for sid, stamp in calls if sid == "good-sys"]
+    assert sorted(good_calls) == [replay_at - timedelta(hours=24), replay_at]
+
+
+def test_compute_report_recency_uses_the_report_clock(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    bootstrap_repo()
+    upsert_system("good-sys", "data/contracts/good-sys-*.json", "data/logs/good-sys-events.jsonl")
+
+    last = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(reporting, "last_event_ts_from_glob", lambda *args, **kwargs: last)
+    monkeypatch.setattr(reporting, "_now_utc", lambda: last + timedelta(days=3))
+
+    report = compute_report(days=30, tail=2000)
+
+    recency = {row["system_id"]: row["days_since_last_event"] for row in report["systems"]["recency"]}
+    assert recency["good-sys"] == 3
+
+
+def test_compute_report_parallel_health_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    bootstrap_repo()
+    for sid in ("alpha-sys", "beta-sys", "gamma-sys"):
+        upsert_system(sid, f"data/contracts/{sid}-*.json", f"data/logs/{sid}-events.jsonl")
+
+    replay_at = datetime(2026, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
+
+    def fake_compute_health_for_system(system_id: str, contracts_glob: str, events_glob: str, *, as_of=None, registry_path=None):
+        score = 95.0 if as_of < replay_at else 60.0 + len(system_id)
+        return {"status": "green" if score >= 85.0 else "red", "violations": [], "score_total": score}
+
+    monkeypatch.setattr(reporting, "compute_health_for_system", fake_compute_health_for_system)
+    _write_history(
+        tmp_path,
+        [
+            {"ts": "2026-02-13T12:00:00Z", "status": "green", "score_total": 95.0, "violations": []},
+            {"ts": "2026-02-14T12:00:00Z", "status": "red", "score_total": 70.0, "violations": []},
+        ],
+    )
+
+    serial = compute_report(days=30, tail=2000, as_of=replay_at)
+    parallel = compute_report(days=30, tail=2000, as_of=replay_at, jobs=4)
+
+    assert parallel == serial
+    assert serial["summary"]["top_drift_24h"] == "beta-sys -27 | alpha-sys -26 | gamma-sys -26"
+
+
 def test_sample_systems_never_appear_in_drift_attribution(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     bootstrap_repo()
@@ -555,6 +772,19 @@ def test_report_json_includes_impact_block() -> None:
     assert isinstance(report["impact"]["impacted"], list)
 
 
+def test_aggregate_non_sample_takes_worst_status_and_mean_score() -> None:
+    rows = [
+        {"system_id": "a", "status": "green", "score_total": 90.0},
+        {"system_id": "b", "status": "unknown", "score_total": 60.0},
+        {"system_id": "c", "status": "yellow", "score_total": 75.0},
+    ]
+    assert reporting._aggregate_non_sample(rows) == {"status": "yellow", "score_total": 75.0, "strict_ready_now": True}
+
+    rows.append({"system_id": "d", "status": "red", "score_total": 10.0})
+    assert reporting._aggregate_non_sample(rows) == {"status": "red", "score_total": 58.75, "strict_ready_now": False}
+    assert reporting._aggregate_non_sample(rows[1:2])["status"] == "green"
+
+
 def test_select_impact_sources_excludes_samples_and_includes_drift() -> None:
     from core.reporting import _select_impact_sources
 
@@ -694,6 +924,28 @@ def test_report_snapshot_write_command_appends_ledger(tmp_path: Path, monkeypatc
     assert "summary" in row and "policy" in row and "systems" in row
 
 
+def test_write_snapshot_ledger_appends_sorted_key_lines(tmp_path: Path) -> None:
+    ledger = tmp_path / "snapshots" / "ledger.jsonl"
+    reports = [
+        {
+            "summary": {"current_status": "green", "now_non_sample": {"status": "green", "score_total": 90.0}},
+            "systems": {"status": [{"system_id": "b"}, {"system_id": "a"}]},
+        },
+        {"summary": {"current_status": "red"}},
+    ]
+
+    for report in reports:
+        assert reporting.write_snapshot_ledger(report, ledger) == ledger
+    reporting.write_snapshot_ledger(reports[0], ledger)
+
+    lines = ledger.read_text(encoding="utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["summary"]["current_status"] for row in rows] == ["green", "red", "green"]
+    # Same on-disk format as core.snapshot's writer: sorted keys, json's default separators.
+    assert lines == [json.dumps(row, sort_keys=True) for row in rows]
+    assert [s["system_id"] for s in rows[0]["systems"]] == ["a", "b"]
+
+
 def test_report_includes_risk_ranking(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     bootstrap_repo()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from core.sla import SLA_THRESHOLDS_DAYS, sla_status, tier_threshold_days
 
@@ -26,3 +26,22 @@ def test_sla_status_supports_iso_z_and_naive_inputs() -> None:
     as_of = datetime(2026, 2, 16, 12, 0, 0, tzinfo=timezone.utc)
     assert sla_status("2026-02-10T12:00:00Z", "prod", as_of=as_of) == "ok"
     assert sla_status("2026-01-01T00:00:00", "prod", as_of=as_of) == "breach"
+
+
+def test_sla_status_threshold_boundary_is_exact() -> None:
+    as_of = datetime(2026, 2, 16, 12, 0, 0, tzinfo=timezone.utc)
+    at_limit = as_of - timedelta(days=SLA_THRESHOLDS_DAYS["prod"])
+
+    assert sla_status(at_limit, "prod", as_of=as_of) == "ok"
+    assert sla_status(at_limit - timedelta(microseconds=1), "prod", as_of=as_of) == "breach"
+    assert sla_status("2026-02-09T12:00:00Z", "prod", as_of=as_of) == "ok"
+    assert sla_status("2026-02-09T11:59:59.999999Z", "prod", as_of=as_of) == "breach"
+
+
+def test_sla_thresholds_follow_updates_to_the_mapping(monkeypatch) -> None:
+    as_of = datetime(2026, 2, 16, 12, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setitem(SLA_THRESHOLDS_DAYS, "prod", 30)
+
+    assert tier_threshold_days("prod") == 30
+    assert tier_threshold_days("unknown-tier") == 30
+    assert sla_status("2026-02-01T12:00:00Z", "prod", as_of=as_of) == "ok"
@@ -4,7 +4,8 @@ import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from core.snapshot import compute_stats, tail_snapshots
+import core.snapshot as snapshot
+from core.snapshot import compute_stats, read_jsonl_tail, tail_snapshots
 
 
 def _write_line(p: Path, obj: dict) -> None:
@@ -71,3 +72,61 @@ def test_compute_stats_counts_reasons_deterministic(tmp_path: Path) -> None:
     top = payload["top_reasons"][0]
     assert top["reason_code"] == "SLA_BREACH"
     assert top["count"] == 2
+
+
+def test_read_jsonl_tail_reads_backward_across_chunks(tmp_path: Path, monkeypatch) -> None:
+    ledger = tmp_path / "report_snapshot_history.jsonl"
+    lines = [json.dumps({"ts": f"2026-02-{day:02d}T00:00:00Z", "i": day}) for day in range(1, 13)]
+    lines[9] = "{not json"
+    lines.insert(7, "")
+    ledger.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    for chunk in (5, 64, 1 << 16):
+        monkeypatch.setattr(snapshot, "_TAIL_CHUNK_BYTES", chunk)
+        # Tails count raw lines, so the blank and bad lines use up slots.
+        assert [r["i"] for r in read_jsonl_tail(ledger_path=ledger, n=3)] == [11, 12]
+        assert [r["i"] for r in read_jsonl_tail(ledger_path=ledger, n=7)] == [7, 8, 9, 11, 12]
+        assert [r["i"] for r in read_jsonl_tail(ledger_path=ledger, n=50)] == [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12]
+
+
+def test_stats_skip_old_rows_by_trailing_ts(tmp_path: Path, monkeypatch) -> None:
+    ledger = tmp_path / "report_snapshot_history.jsonl"
+    now = datetime(2026, 2, 16, 12, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(snapshot, "_utcnow", lambda: now)
+    old = (now - timedelta(days=10)).isoformat().replace("+00:00", "Z")
+    recent = (now - timedelta(hours=1)).isoformat().replace("+00:00", "Z")
+    failure = {"strict_failed": True, "policy": {}, "reasons": [{"reason_code": "SLA_BREACH", "tier": "prod"}]}
+
+    ledger.write_text(json.dumps({"ts": old, "summary": {"status": "red"}}, sort_keys=True) + "\n", encoding="utf-8")
+    quiet = compute_stats(ledger, days=7)
+    # A ledger whose rows all predate the window still reports the window, not an empty ledger.
+    assert quiet["total"] == 0
+    assert quiet["window_start"] == "2026-02-09T12:00:00Z"
+
+    with ledger.open("a", encoding="utf-8") as f:
+        for row in (
+            {"ts": recent, "summary": {"status": "green"}, "strict_failure": failure},
+            # Looks like an old trailing ts, but it is text inside the last string value.
+            {"ts": recent, "summary": {"status": "yellow"}, "zz": f'x", "ts": "{old}"}}'},
+        ):
+            f.write(json.dumps(row, sort_keys=True) + "\n")
+
+    stats = compute_stats(ledger, days=7)
+    assert stats["total"] == 2
+    assert stats["status_counts"] == {"green": 1, "yellow": 1, "red": 0, "unknown": 0}
+    assert snapshot.snapshot_stats(ledger_path=ledger, days=7)["rows"] == 2
+    assert snapshot.snapshot_stats(ledger_path=ledger, days=7)["reason_codes"] == {"SLA_BREACH": 1}
+
+
+def test_write_snapshot_ledger_batch_appends_one_line_per_report(tmp_path: Path) -> None:
+    ledger = tmp_path / "snapshots" / "report_snapshot_history.jsonl"
+    reports = [{"summary": {"status": "green"}}, {"summary": {"status": "red"}, "strict_failure": {"b": 1, "a": 2}}]
+
+    assert snapshot.write_snapshot_ledger_batch(reports, ledger) == ledger
+    snapshot.write_snapshot_ledger(reports[0], ledger)
+    snapshot.write_snapshot_ledger_batch([], ledger)
+
+    lines = ledger.read_text(encoding="utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["summary"]["status"] for row in rows] == ["green", "red", "green"]
+    assert lines == [json.dumps(row, sort_keys=True) for row in rows]
@@ -55,3 +55,23 @@ def test_snapshot_diff_bad_refs(tmp_path: Path) -> None:
     _write_ledger(ledger, [{"ts": "t", "snapshot": {"systems": []}}])
     out = snapshot_diff_from_ledger(ledger, a="nope", b="latest", tail=10)
     assert out["error"] == "BAD_REF"
+
+
+def test_snapshot_diff_ts_ref_picks_first_match_then_same_instant(tmp_path: Path) -> None:
+    ledger = tmp_path / "ledger.jsonl"
+
+    def row(ts: str, status: str) -> dict:
+        return {"ts": ts, "snapshot": {"ts": ts, "systems": [{"system_id": "x", "status": status}]}}
+
+    _write_ledger(
+        ledger,
+        [
+            row("2026-02-16T12:00:00Z", "green"),
+            row("2026-02-16T12:00:00Z", "red"),
+            row("2026-02-16T13:00:00Z", "yellow"),
+        ],
+    )
+
+    out = snapshot_diff_from_ledger(ledger, a="2026-02-16T12:00:00Z", b="2026-02-16T08:00:00-05:00", tail=10)
+    assert "error" not in out
+    assert out["diff"]["system_status_changes"] == [{"system_id": "x", "from": "green", "to": "yellow"}]